@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import importlib.util
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -104,6 +105,43 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing
+# PASSWORD_HASHER_POLICY picks the hasher for new hashes ("argon2" or
+# "scrypt"); existing PBKDF2 hashes still verify and are upgraded on login.
+
+PASSWORD_HASHER_POLICY = 'argon2'
+
+PASSWORD_HASHER_COST = {
+    'argon2': {'time_cost': 2, 'memory_cost': 19456, 'parallelism': 1},
+    'scrypt': {'work_factor': 2 ** 14, 'block_size': 8, 'parallelism': 1},
+}
+
+# find_spec() checks availability without paying for the import at startup
+if importlib.util.find_spec('argon2') is None:
+    PASSWORD_HASHER_POLICY = 'scrypt'
+
+_POLICY_HASHERS = {
+    'argon2': 'events.hashers.TunedArgon2PasswordHasher',
+    'scrypt': 'events.hashers.TunedScryptPasswordHasher',
+}
+
+PASSWORD_HASHERS = [
+    _POLICY_HASHERS[PASSWORD_HASHER_POLICY],
+    *[h for p, h in _POLICY_HASHERS.items() if p != PASSWORD_HASHER_POLICY],
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+AUTHENTICATION_BACKENDS = [
+    'events.backends.PooledModelBackend',
+]
+
+# Hashing runs on a bounded thread pool (0 workers = hash inline).
+PASSWORD_HASHING_WORKERS = 2
+PASSWORD_HASHING_QUEUE = 32
+PASSWORD_HASHING_TIMEOUT = 5
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -121,6 +159,20 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Uploaded media. Profile pictures are stored under their content hash, so
+# anything below MEDIA_URL can be served with a far-future, immutable
+# Cache-Control header.
+
+MEDIA_URL = 'media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
+PROFILE_PICTURE_MAX_BYTES = 5 * 1024 * 1024
+PROFILE_PICTURE_MAX_DIMENSIONS = (4096, 4096)
+PROFILE_PICTURE_THUMBNAIL_SIZES = (64, 128, 256)
+PROFILE_PICTURE_DEFAULT_SIZE = 128
+# Background thumbnail workers (0 = generate inline after commit).
+PROFILE_PICTURE_WORKERS = 1
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -149,6 +201,66 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Longest window the occurrence (calendar) listing will expand.
+OCCURRENCE_WINDOW_MAX_DAYS = 366
+
+# Limits on recurrence rules accepted by the API: at most this many
+# occurrences, and a bounded series must end within this many days of its
+# first start.
+RECURRENCE_MAX_COUNT = 1000
+RECURRENCE_MAX_SPAN_DAYS = 3660
+
+# Events whose series ended more than this many days ago are moved to the
+# archive tables by `manage.py archive_events`, in batches of this many events.
+ARCHIVE_HORIZON_DAYS = 90
+ARCHIVE_BATCH_SIZE = 500
+
+# Event deletes hide the event and purge RSVPs/reviews in batches of this
+# size on a background worker (0 workers = purge inline after commit).
+EVENT_PURGE_BATCH_SIZE = 500
+EVENT_PURGE_WORKERS = 1
+
+# Rows per bulk_create batch for event imports.
+EVENT_IMPORT_BATCH_SIZE = 500
+
+# Shared cache tier. Local memory is per process; point this at Redis or
+# Memcached so every worker shares hot-event entries and invalidations.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# Hot-event read cache (event detail and first review page), see events/caching.py.
+# MAX_BYTES bounds the per-process LRU by rendered JSON size; entries are fresh
+# for FRESH_SECONDS, then served stale for up to STALE_SECONDS while one
+# request refreshes them. WAIT_SECONDS caps how long coalesced requests wait.
+EVENT_CACHE = {
+    "SHARED_ALIAS": "default",
+    "MAX_BYTES": 16 * 1024 * 1024,
+    "FRESH_SECONDS": 30,
+    "STALE_SECONDS": 300,
+    "WAIT_SECONDS": 5,
+}
+
+# Review moderation heuristics, see events/moderation.py. A review is held as
+# pending when its comment (MIN_CHARS or longer) is at least
+# DUPLICATE_THRESHOLD similar to one of the event's last RECENT_PER_EVENT
+# reviews, or its author already posted RATE_LIMIT reviews within
+# RATE_WINDOW_SECONDS. MAX_EVENTS / MAX_USERS bound the in-memory index.
+REVIEW_MODERATION = {
+    "SHINGLE_SIZE": 5,
+    "SKETCH_SIZE": 64,
+    "DUPLICATE_THRESHOLD": 0.8,
+    "MIN_CHARS": 20,
+    "RECENT_PER_EVENT": 200,
+    "MAX_EVENTS": 10000,
+    "RATE_LIMIT": 5,
+    "RATE_WINDOW_SECONDS": 3600,
+    "MAX_USERS": 100000,
+    "BATCH_SIZE": 1000,
+}
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
@@ -0,0 +1,54 @@
+"""
+API-only settings profile for eventproj.
+
+For workers that only serve the JWT-authenticated JSON API:
+
+    DJANGO_SETTINGS_MODULE=eventproj.settings_api gunicorn eventproj.wsgi
+
+Drops the apps and middleware the API never uses (admin, sessions, messages,
+staticfiles, authtoken, CSRF) so each worker imports and initialises less.
+Session login (``/api-auth``-style or ``client.login``) is not available
+under this profile; use ``/api/auth/token/``.
+"""
+from .settings import *  # noqa: F401,F403
+from .settings import INSTALLED_APPS, MIDDLEWARE, REST_FRAMEWORK, TEMPLATES
+
+UNUSED_APPS = {
+    'django.contrib.admin',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+    'rest_framework.authtoken',
+}
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in UNUSED_APPS]
+
+# AuthenticationMiddleware needs sessions; DRF authenticates JWT requests itself.
+UNUSED_MIDDLEWARE = {
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+}
+
+MIDDLEWARE = [middleware for middleware in MIDDLEWARE if middleware not in UNUSED_MIDDLEWARE]
+
+TEMPLATES = [
+    {
+        **TEMPLATES[0],
+        'OPTIONS': {
+            **TEMPLATES[0]['OPTIONS'],
+            'context_processors': [
+                processor for processor in TEMPLATES[0]['OPTIONS']['context_processors']
+                if processor != 'django.contrib.messages.context_processors.messages'
+            ],
+        },
+    },
+]
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    "DEFAULT_AUTHENTICATION_CLASSES": (
+        "rest_framework_simplejwt.authentication.JWTAuthentication",
+    ),
+}
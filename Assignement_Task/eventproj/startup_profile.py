@@ -0,0 +1,54 @@
+"""
+Cold-start probe used by ``manage.py profile_startup``.
+
+    python -X importtime -m eventproj.startup_profile <settings module> <path>
+
+Boots Django the way a WSGI worker does, serves one GET request for <path>
+without the test client (which would add its own imports), and prints the
+timings and peak RSS as JSON on stdout. ``-X importtime`` output goes to
+stderr for the caller to aggregate.
+"""
+import json
+import os
+import resource
+import sys
+import time
+
+
+def main(settings_module, path):
+    started = time.perf_counter()
+    os.environ["DJANGO_SETTINGS_MODULE"] = settings_module
+
+    from django.core.wsgi import get_wsgi_application
+    application = get_wsgi_application()
+    booted = time.perf_counter()
+
+    from io import BytesIO
+    from wsgiref.util import setup_testing_defaults
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "HTTP_HOST": "localhost",
+        "wsgi.input": BytesIO(),
+    }
+    setup_testing_defaults(environ)
+    statuses = []
+    response = application(environ, lambda status, headers, exc_info=None: statuses.append(status))
+    b"".join(response)
+    answered = time.perf_counter()
+
+    json.dump({
+        "settings": settings_module,
+        "path": path,
+        "status": statuses[0] if statuses else None,
+        "boot_ms": (booted - started) * 1000,
+        "first_request_ms": (answered - booted) * 1000,
+        "total_ms": (answered - started) * 1000,
+        "modules": len(sys.modules),
+        # ru_maxrss is KiB on Linux
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }, sys.stdout)
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:3])
@@ -14,7 +14,10 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
-from django.urls import path, include
+from django.conf import settings
+from django.urls import path, include, re_path
+from django.utils.cache import patch_cache_control
+from django.views.static import serve
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView
@@ -27,3 +30,15 @@ urlpatterns = [
     path("api/",include("events.urls")),
 ]
 
+
+def serve_media(request, path):
+    # Development only; media names are content hashes, so never revalidate
+    response = serve(request, path, document_root=settings.MEDIA_ROOT)
+    patch_cache_control(response, public=True, max_age=31536000, immutable=True)
+    return response
+
+
+if settings.DEBUG:
+    urlpatterns += [
+        re_path(r"^%s(?P<path>.*)$" % settings.MEDIA_URL.lstrip("/"), serve_media),
+    ]
@@ -1,3 +1,29 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Review
+
+
+# ---------------------------------------------------------
+# REVIEW MODERATION QUEUE
+# ---------------------------------------------------------
+@admin.register(Review)
+class ReviewAdmin(admin.ModelAdmin):
+    list_display = ["event", "user", "rating", "status", "flags", "created_at"]
+    list_filter = ["status"]
+    search_fields = ["comment", "user__username", "event__title"]
+    raw_id_fields = ["user", "event"]
+    actions = ["publish", "reject"]
+
+    @admin.action(description="Publish selected reviews")
+    def publish(self, request, queryset):
+        self._set_status(queryset, Review.PUBLISHED)
+
+    @admin.action(description="Reject selected reviews")
+    def reject(self, request, queryset):
+        self._set_status(queryset, Review.REJECTED)
+
+    def _set_status(self, queryset, status):
+        # One save() per review so the event read cache is invalidated
+        for review in queryset:
+            review.status = status
+            review.save(update_fields=["status"])
@@ -0,0 +1,135 @@
+"""
+Archival tiering for past events.
+
+Events whose series ended more than ARCHIVE_HORIZON_DAYS ago are moved, with
+their RSVPs and reviews, from the hot tables into the ``Archived*`` tables in
+batches of ARCHIVE_BATCH_SIZE events, one transaction per batch. Default
+querysets therefore only see the hot tier; the API reads the archive only
+when asked with ``?include_archived=1``.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+
+from .caching import invalidate_event
+from .models import ArchivedEvent, ArchivedReview, ArchivedRSVP, Event, Review, RSVP
+
+# (hot model, archive model) pairs, parents first
+TIERS = [
+    (Event, ArchivedEvent),
+    (RSVP, ArchivedRSVP),
+    (Review, ArchivedReview),
+]
+
+
+def _field_names(model):
+    return [f.attname for f in model._meta.concrete_fields]
+
+
+def _move(source_model, target_model, lookup, ids):
+    """Copy rows matching ``lookup`` into ``target_model``, keeping primary keys."""
+    target_fields = _field_names(target_model)
+    fields = [name for name in _field_names(source_model) if name in target_fields]
+    queryset = source_model.objects.filter(**{lookup: ids})
+    rows = [target_model(**values) for values in queryset.values(*fields)]
+    target_model.objects.bulk_create(rows, batch_size=settings.ARCHIVE_BATCH_SIZE)
+
+    # bulk_create stamps auto_now(_add) fields with the current time
+    stamped = [
+        f.attname for f in target_model._meta.concrete_fields
+        if (getattr(f, "auto_now", False) or getattr(f, "auto_now_add", False))
+        and f.attname in fields
+    ]
+    if rows and stamped:
+        original = source_model.objects.filter(pk=OuterRef("pk"))
+        target_model.objects.filter(**{lookup: ids}).update(
+            **{name: Subquery(original.values(name)[:1]) for name in stamped}
+        )
+    return len(rows)
+
+
+def _move_batch(ids, direction):
+    """Move events ``ids`` and their dependents to the other tier."""
+    pairs = TIERS if direction == "archive" else [(b, a) for a, b in TIERS]
+    lookups = ["pk__in", "event_id__in", "event_id__in"]
+    moved = 0
+    with transaction.atomic():
+        # Parents are inserted first and deleted last
+        for (source, target), lookup in zip(pairs, lookups):
+            moved += _move(source, target, lookup, ids)
+        for (source, _), lookup in reversed(list(zip(pairs, lookups))):
+            source.objects.filter(**{lookup: ids}).delete()
+        for event_id in ids:
+            invalidate_event(event_id)
+    return moved
+
+
+def archive_events(horizon=None, batch_size=None, now=None):
+    """
+    Move finished events older than ``horizon`` into the archive.
+
+    Open-ended recurring series (``series_end`` is NULL) are never archived.
+    Returns the number of events archived.
+    """
+    horizon = horizon if horizon is not None else timedelta(days=settings.ARCHIVE_HORIZON_DAYS)
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    cutoff = (now or timezone.now()) - horizon
+
+    archived = 0
+    while True:
+        ids = list(
+            Event.objects.filter(series_end__lt=cutoff)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            return archived
+        _move_batch(ids, "archive")
+        archived += len(ids)
+
+
+def restore_events(ids, batch_size=None):
+    """Move archived events ``ids`` back into the hot tier."""
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    ids = list(ArchivedEvent.objects.filter(pk__in=ids).order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(ids), batch_size):
+        _move_batch(ids[start:start + batch_size], "restore")
+    return len(ids)
+
+
+class TieredSequence:
+    """
+    Hot queryset followed by archived queryset, as one sliceable sequence.
+
+    Lets the paginator page through the hot tier first and fall through into
+    the archive; archived rows are only fetched once the hot rows run out.
+    """
+
+    def __init__(self, hot, archived):
+        self.hot = hot
+        self.archived = archived
+        self._hot_count = None
+
+    def hot_count(self):
+        if self._hot_count is None:
+            self._hot_count = self.hot.count()
+        return self._hot_count
+
+    def count(self):
+        return self.hot_count() + self.archived.count()
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        start, stop = index.start or 0, index.stop
+        hot_count = self.hot_count()
+        rows = list(self.hot[start:min(stop, hot_count)]) if start < hot_count else []
+        if stop > hot_count:
+            rows += list(self.archived[max(start - hot_count, 0):stop - hot_count])
+        return rows
@@ -0,0 +1,38 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from .hashers import make_password_pooled, verify_password_pooled
+
+UserModel = get_user_model()
+
+
+class PooledModelBackend(ModelBackend):
+    """
+    ModelBackend that hashes on the bounded hashing pool.
+
+    Database access stays on the request thread; only the hash itself is
+    offloaded. Correct passwords stored with an outdated hasher or cost are
+    re-hashed and saved in place, so changing PASSWORD_HASHER_POLICY or
+    PASSWORD_HASHER_COST migrates users as they log in.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # Same timing mitigation as ModelBackend (Django #20760).
+            make_password_pooled(password)
+            return
+
+        is_correct, must_update = verify_password_pooled(password, user.password)
+        if not is_correct:
+            return
+        if must_update:
+            user.password = make_password_pooled(password)
+            user.save(update_fields=["password"])
+        if self.user_can_authenticate(user):
+            return user
@@ -0,0 +1,50 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+
+_lock = threading.Lock()
+_executors = {}
+
+
+def _get_executor(workers_setting, queue_setting=None):
+    """Per-process ``(executor, slots)`` sized by ``settings.<workers_setting>``.
+
+    ``slots`` is a semaphore of ``settings.<queue_setting>`` permits for
+    callers that bound how many calls may be queued or running, or None.
+    Keyed on the pid so workers forked from a preloaded master never
+    inherit a dead executor.
+    """
+    key = (workers_setting, os.getpid())
+    with _lock:
+        if key not in _executors:
+            executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, workers_setting),
+                thread_name_prefix=workers_setting.lower(),
+            )
+            slots = None
+            if queue_setting is not None:
+                slots = threading.BoundedSemaphore(getattr(settings, queue_setting))
+            _executors[key] = (executor, slots)
+        return _executors[key]
+
+
+def _run(fn, *args):
+    try:
+        return fn(*args)
+    finally:
+        # Pool threads would otherwise keep their DB connections forever
+        connections.close_all()
+
+
+def submit(workers_setting, fn, *args):
+    """
+    Run ``fn(*args)`` off the request path on the pool sized by the
+    ``workers_setting`` setting, or inline when that setting is 0.
+    """
+    if not getattr(settings, workers_setting):
+        return fn(*args)
+    executor, _ = _get_executor(workers_setting)
+    return executor.submit(_run, fn, *args)
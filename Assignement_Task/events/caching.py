@@ -0,0 +1,240 @@
+"""
+Read cache for hot events: event detail and the first page of reviews.
+
+Two tiers: a per-process LRU bounded by EVENT_CACHE["MAX_BYTES"] in front of
+the shared Django cache EVENT_CACHE["SHARED_ALIAS"]. Misses are single-flight
+(one request per key recomputes, concurrent ones wait for its result) and
+entries past their fresh TTL are served stale while one request refreshes
+them. Writes bump a per-event generation in the shared cache, which changes
+every key of that event in every process; changes made elsewhere (such as
+the owner's profile picture) show up once entries expire.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Event, Review, RSVP
+
+
+def _plain(value):
+    """
+    ``value`` round-tripped through JSON, and its rendered size. Serializer
+    output (ReturnDict/ReturnList) keeps a backlink to the serializer, and
+    through it the request and view, which the byte budget would not count.
+    """
+    # Deferred: EventsConfig.ready() imports this module, and the renderers
+    # pull in most of DRF (plus yaml/pygments) for every manage.py command
+    from rest_framework.renderers import JSONRenderer
+
+    rendered = JSONRenderer().render(value)
+    return (json.loads(rendered) if rendered else None), len(rendered)
+
+
+class _Entry:
+    __slots__ = ("value", "size", "fresh_until", "stale_until")
+
+    def __init__(self, value, size, fresh_until, stale_until):
+        self.value = value
+        self.size = size
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class _Flight:
+    """One in-progress computation other requests can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ReadThroughCache:
+    """
+    Local LRU/TTL tier + shared Django cache tier with single-flight
+    recomputation and stale-while-revalidate.
+    """
+
+    def __init__(self, max_bytes, fresh_seconds, stale_seconds, shared_alias, wait_seconds):
+        self.max_bytes = max_bytes
+        self.fresh_seconds = fresh_seconds
+        self.stale_seconds = stale_seconds
+        self.shared_alias = shared_alias
+        self.wait_seconds = wait_seconds
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._flights = {}
+        self._bytes = 0
+        self.metrics = dict.fromkeys(
+            ["hits", "shared_hits", "misses", "coalesced", "stale_served", "evictions"], 0
+        )
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias]
+
+    def _count(self, metric):
+        # Callers hold self._lock or accept a racy counter
+        self.metrics[metric] += 1
+
+    # -- local tier --------------------------------------------------------
+    def _store_local(self, key, entry):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            if entry.size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._count("evictions")
+
+    def _make_entry(self, value, size):
+        now = time.monotonic()
+        return _Entry(value, size, now + self.fresh_seconds, now + self.fresh_seconds + self.stale_seconds)
+
+    # -- lookup ------------------------------------------------------------
+    def get_or_compute(self, key, compute):
+        """Return the cached value for ``key``, computing it at most once."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now >= entry.stale_until:
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if now < entry.fresh_until:
+                    self._count("hits")
+                    return entry.value
+
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            elif entry is not None:
+                # Someone is already refreshing: serve the stale copy
+                self._count("stale_served")
+                return entry.value
+            else:
+                self._count("coalesced")
+
+        if not leader:
+            if not flight.done.wait(self.wait_seconds):
+                return compute()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = self._load(key, compute)
+            flight.value = value
+            return value
+        except Exception as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def _load(self, key, compute):
+        shared = self.shared.get(key)
+        if shared is not None:
+            self._count("shared_hits")
+            value, size = shared
+            self._store_local(key, self._make_entry(value, size))
+            return value
+
+        self._count("misses")
+        value, size = _plain(compute())
+        self._store_local(key, self._make_entry(value, size))
+        self.shared.set(key, (value, size), self.fresh_seconds)
+        return value
+
+    def clear(self):
+        """Empty the local tier and reset the metrics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.metrics = dict.fromkeys(self.metrics, 0)
+
+    def stats(self):
+        with self._lock:
+            return {**self.metrics, "entries": len(self._entries), "bytes": self._bytes}
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def event_cache():
+    """The process-wide cache configured by settings.EVENT_CACHE."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            config = settings.EVENT_CACHE
+            _cache = ReadThroughCache(
+                max_bytes=config["MAX_BYTES"],
+                fresh_seconds=config["FRESH_SECONDS"],
+                stale_seconds=config["STALE_SECONDS"],
+                shared_alias=config["SHARED_ALIAS"],
+                wait_seconds=config["WAIT_SECONDS"],
+            )
+        return _cache
+
+
+# ---------------------------------------------------------
+# EVENT KEYS AND INVALIDATION
+# ---------------------------------------------------------
+def _generation_key(event_id):
+    return f"event:{event_id}:generation"
+
+
+def event_key(event_id, view, *variant):
+    """Cache key for one rendering of an event; changes when the event does."""
+    generation = event_cache().shared.get(_generation_key(event_id), 0)
+    return ":".join(["event", str(event_id), f"g{generation}", view, *map(str, variant)])
+
+
+def _bump_generation(event_id):
+    shared = event_cache().shared
+    key = _generation_key(event_id)
+    # add() is a no-op if the key exists; incr() then moves it on atomically
+    shared.add(key, 0, timeout=None)
+    try:
+        shared.incr(key)
+    except ValueError:
+        shared.set(key, 1, timeout=None)
+
+
+def invalidate_event(event_id):
+    """
+    Drop every cached rendering of ``event_id``. Bumped again on commit so a
+    read racing the write cannot re-cache the old row.
+    """
+    _bump_generation(event_id)
+    transaction.on_commit(lambda: _bump_generation(event_id))
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def _event_changed(sender, instance, **kwargs):
+    invalidate_event(instance.pk)
+
+
+# No post_delete for RSVP/Review: it would stop Django's fast (no-load)
+# deletes used by events.purge, which invalidates explicitly instead.
+@receiver(post_save, sender=RSVP)
+@receiver(post_save, sender=Review)
+def _dependent_changed(sender, instance, **kwargs):
+    invalidate_event(instance.event_id)
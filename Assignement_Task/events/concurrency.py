@@ -0,0 +1,47 @@
+"""
+Optimistic concurrency for event writes.
+
+Event responses carry ``ETag: "<version>"``. An update sent with
+``If-Match`` is applied by a conditional ``UPDATE ... WHERE version = v``
+per listed version (Event.conditional_update) and fails with 412 if the
+event has changed since. ``If-Match: *`` only requires the event to exist
+and writes over whatever version is current. Without ``If-Match`` the
+update is conditioned on the version the request itself read, so a
+concurrent edit is never silently overwritten.
+"""
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "The event has been modified since you fetched it; reload it and retry."
+    default_code = "precondition_failed"
+
+
+def etag(version):
+    return f'"{version}"'
+
+
+# If-Match: * -- any current version
+ANY = "*"
+
+
+def if_match_versions(request):
+    """
+    Versions listed in the request's ``If-Match`` header, ANY for ``*``, or
+    None when there is no header. Weak or foreign tags never match.
+    """
+    header = request.headers.get("If-Match")
+    if header is None:
+        return None
+    if header.strip() == "*":
+        return ANY
+    versions = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        if len(tag) > 2 and tag[0] == tag[-1] == '"' and tag[1:-1].isdigit():
+            versions.append(int(tag[1:-1]))
+    if not versions:
+        raise PreconditionFailed()
+    return versions
@@ -0,0 +1,101 @@
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    ScryptPasswordHasher,
+    make_password,
+    verify_password,
+)
+from rest_framework.exceptions import APIException
+
+from .background import _get_executor
+
+
+def _cost(policy, name, default):
+    """Read a tuned cost parameter from settings.PASSWORD_HASHER_COST."""
+    costs = getattr(settings, "PASSWORD_HASHER_COST", {}).get(policy, {})
+    return costs.get(name, default)
+
+
+# ---------------------------------------------------------
+# 1. TUNED HASHERS
+# ---------------------------------------------------------
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id with cost parameters taken from settings.
+
+    Shares the ``argon2`` algorithm name with Django's hasher, so hashes made
+    with other parameters still verify and get upgraded on the next login.
+    """
+
+    @property
+    def time_cost(self):
+        return _cost("argon2", "time_cost", super().time_cost)
+
+    @property
+    def memory_cost(self):
+        return _cost("argon2", "memory_cost", super().memory_cost)
+
+    @property
+    def parallelism(self):
+        return _cost("argon2", "parallelism", super().parallelism)
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    """Scrypt with cost parameters taken from settings."""
+
+    @property
+    def work_factor(self):
+        return _cost("scrypt", "work_factor", super().work_factor)
+
+    @property
+    def block_size(self):
+        return _cost("scrypt", "block_size", super().block_size)
+
+    @property
+    def parallelism(self):
+        return _cost("scrypt", "parallelism", super().parallelism)
+
+    @property
+    def maxmem(self):
+        # OpenSSL refuses anything above 32 MiB unless told otherwise.
+        return 2 * 128 * self.work_factor * self.block_size * self.parallelism
+
+
+# ---------------------------------------------------------
+# 2. BOUNDED HASHING POOL
+# ---------------------------------------------------------
+class HashingPoolBusy(APIException):
+    status_code = 503
+    default_detail = "Too many sign-ins in progress, please retry shortly."
+    default_code = "hashing_pool_busy"
+
+
+def run_in_pool(fn, *args):
+    """Run a CPU-bound hashing call on the bounded pool and wait for it.
+
+    The hash functions release the GIL, so at most PASSWORD_HASHING_WORKERS
+    cores are spent on hashing while request threads keep serving the event
+    API. At most PASSWORD_HASHING_QUEUE calls may be queued or running; past
+    that, callers wait PASSWORD_HASHING_TIMEOUT seconds and then get a 503.
+    """
+    if not settings.PASSWORD_HASHING_WORKERS:
+        return fn(*args)
+
+    executor, slots = _get_executor("PASSWORD_HASHING_WORKERS", "PASSWORD_HASHING_QUEUE")
+    if not slots.acquire(timeout=settings.PASSWORD_HASHING_TIMEOUT):
+        raise HashingPoolBusy()
+    try:
+        future = executor.submit(fn, *args)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    return future.result()
+
+
+def make_password_pooled(password):
+    return run_in_pool(make_password, password)
+
+
+def verify_password_pooled(password, encoded):
+    """Return ``(is_correct, must_update)`` like Django's verify_password."""
+    return run_in_pool(verify_password, password, encoded)
@@ -0,0 +1,227 @@
+"""
+Bulk event import shared by ``POST /api/events/import/`` and
+``manage.py import_events``.
+
+Input is parsed as a stream (CSV, a JSON array or JSON lines), each row is
+checked by a lightweight validator instead of EventSerializer, and valid rows
+are inserted with ``bulk_create`` in EVENT_IMPORT_BATCH_SIZE batches. Invalid
+rows are reported with their row number and never abort the import.
+"""
+import codecs
+import csv
+import json
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import Event
+
+IMPORT_FORMATS = ("csv", "json")
+
+TRUE_VALUES = {"1", "true", "yes", "y", "t"}
+FALSE_VALUES = {"0", "false", "no", "n", "f"}
+
+
+# ---------------------------------------------------------
+# 1. STREAMING PARSERS
+# ---------------------------------------------------------
+def iter_csv_rows(stream):
+    """Yield dicts from a binary CSV stream, one line at a time."""
+    def lines():
+        for number, line in enumerate(iter(stream.readline, b"")):
+            text = line.decode("utf-8")
+            yield text.lstrip("\ufeff") if number == 0 else text
+
+    yield from csv.DictReader(lines())
+
+
+def iter_json_rows(stream, chunk_size=64 * 1024):
+    """
+    Yield values from a binary stream holding a JSON array or JSON lines,
+    decoding one value at a time so the document is never held in memory.
+    Raises ValueError on malformed input.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    position = 0
+    eof = False
+
+    while True:
+        # Skip whitespace and array punctuation between values
+        while position < len(buffer) and buffer[position] in " \t\r\n,[]":
+            position += 1
+        if position >= len(buffer) and eof:
+            return
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+            # A bare scalar touching the end of the buffer may be cut short
+            complete = eof or end < len(buffer) or isinstance(value, (dict, list))
+        except json.JSONDecodeError as exc:
+            if eof:
+                raise ValueError(f"Malformed JSON: {exc.msg}") from None
+            complete = False
+        if not complete:
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[position:] + utf8.decode(chunk, final=eof)
+            position = 0
+            continue
+        position = end
+        yield value
+
+
+def iter_rows(stream, import_format):
+    if import_format == "csv":
+        return iter_csv_rows(stream)
+    return iter_json_rows(stream)
+
+
+# ---------------------------------------------------------
+# 2. LIGHTWEIGHT ROW VALIDATOR
+# ---------------------------------------------------------
+def _parse_time(value):
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = parse_datetime(value.strip())
+    except ValueError:
+        return None
+    if parsed is not None and timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def _parse_bool(value):
+    if value is None or value == "":
+        return True
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    return None
+
+
+def validate_row(row):
+    """
+    Return ``(values, errors)`` for one input row; ``values`` is None when
+    ``errors`` is not empty. Checks the same constraints as the model plus
+    ``end_time > start_time``.
+    """
+    if not isinstance(row, dict):
+        return None, {"non_field_errors": ["Expected an object."]}
+
+    errors = {}
+    values = {}
+    for field, max_length, required in (
+        ("title", 200, True),
+        ("location", 255, False),
+        ("description", None, False),
+    ):
+        value = row.get(field)
+        value = "" if value is None else str(value).strip()
+        if required and not value:
+            errors[field] = ["This field is required."]
+        elif max_length and len(value) > max_length:
+            errors[field] = [f"Ensure this field has no more than {max_length} characters."]
+        values[field] = value
+
+    for field in ("start_time", "end_time"):
+        values[field] = _parse_time(row.get(field))
+        if values[field] is None:
+            errors[field] = ["Enter a valid date/time."]
+    if "start_time" not in errors and "end_time" not in errors:
+        if values["end_time"] <= values["start_time"]:
+            errors["end_time"] = ["Must be after start_time."]
+
+    values["is_public"] = _parse_bool(row.get("is_public"))
+    if values["is_public"] is None:
+        errors["is_public"] = ["Must be a valid boolean."]
+
+    if errors:
+        return None, errors
+    return values, {}
+
+
+# ---------------------------------------------------------
+# 3. BATCHED INSERT
+# ---------------------------------------------------------
+def _insert(batch, owner, dedup, seen):
+    """Insert one batch of ``(row_number, values)``; return (created, skipped rows)."""
+    skipped = []
+    if dedup:
+        existing = set(
+            Event.objects.filter(
+                owner=owner,
+                start_time__in={values["start_time"] for _, values in batch},
+            ).values_list("title", "start_time")
+        )
+        unique = []
+        for number, values in batch:
+            key = (values["title"], values["start_time"])
+            if key in existing or key in seen:
+                skipped.append(number)
+            else:
+                seen.add(key)
+                unique.append((number, values))
+        batch = unique
+
+    events = [
+        # bulk_create bypasses Event.save(), which sets series_end
+        Event(owner=owner, series_end=values["end_time"], **values)
+        for _, values in batch
+    ]
+    with transaction.atomic():
+        Event.objects.bulk_create(events)
+    return len(events), skipped
+
+
+def import_events(rows, owner, dedup=False, batch_size=None):
+    """
+    Validate and insert ``rows`` for ``owner``.
+
+    With ``dedup`` rows whose ``(owner, title, start_time)`` already exists,
+    in the database or earlier in the same input, are skipped. Returns
+    ``{"created", "skipped", "errors"}`` where ``errors`` lists
+    ``{"row": n, "errors": {...}}`` with 1-based row numbers.
+    """
+    batch_size = batch_size or settings.EVENT_IMPORT_BATCH_SIZE
+    result = {"created": 0, "skipped": [], "errors": []}
+    seen = set()
+    batch = []
+
+    def flush():
+        created, skipped = _insert(batch, owner, dedup, seen)
+        result["created"] += created
+        result["skipped"] += skipped
+        batch.clear()
+
+    number = 0
+    rows = iter(rows)
+    while True:
+        try:
+            row = next(rows)
+        except StopIteration:
+            break
+        except (ValueError, csv.Error) as exc:
+            # Unreadable input: keep what was imported, report where it broke
+            result["errors"].append({"row": number + 1, "errors": {"non_field_errors": [str(exc)]}})
+            break
+        number += 1
+
+        values, errors = validate_row(row)
+        if errors:
+            result["errors"].append({"row": number, "errors": errors})
+            continue
+        batch.append((number, values))
+        if len(batch) >= batch_size:
+            flush()
+
+    if batch:
+        flush()
+    return result
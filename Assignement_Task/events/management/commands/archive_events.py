@@ -0,0 +1,21 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from events.archive import archive_events
+
+
+class Command(BaseCommand):
+    help = "Move events that ended before the archive horizon, with their RSVPs and reviews, to the archive tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--horizon-days", type=int, default=settings.ARCHIVE_HORIZON_DAYS)
+        parser.add_argument("--batch-size", type=int, default=settings.ARCHIVE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        archived = archive_events(
+            horizon=timedelta(days=options["horizon_days"]),
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} event(s)."))
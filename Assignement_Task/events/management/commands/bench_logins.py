@@ -0,0 +1,53 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hashers, verify_password
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Measure password verifications (logins) per second per core for each configured hasher."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seconds", type=float, default=2.0, help="Time spent per measurement.")
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=settings.PASSWORD_HASHING_WORKERS or 1,
+            help="Threads for the pooled run (defaults to PASSWORD_HASHING_WORKERS).",
+        )
+
+    def handle(self, *args, **options):
+        seconds = options["seconds"]
+        threads = max(1, options["threads"])
+        password = "correct horse battery staple"
+
+        self.stdout.write(f"cpu cores: {os.cpu_count()}  pooled threads: {threads}")
+        self.stdout.write(f"{'hasher':<40} {'login/s/core':>14} {'login/s pooled':>16}")
+
+        for hasher in get_hashers():
+            try:
+                encoded = hasher.encode(password, hasher.salt())
+            except ValueError as exc:  # library missing
+                self.stdout.write(f"{type(hasher).__name__:<40} skipped: {exc}")
+                continue
+
+            single = self._measure(encoded, password, seconds, 1)
+            pooled = self._measure(encoded, password, seconds, threads)
+            self.stdout.write(f"{type(hasher).__name__:<40} {single:>14.1f} {pooled:>16.1f}")
+
+    def _measure(self, encoded, password, seconds, threads):
+        def worker():
+            count = 0
+            deadline = time.perf_counter() + seconds
+            while time.perf_counter() < deadline:
+                verify_password(password, encoded)
+                count += 1
+            return count
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            total = sum(executor.map(lambda _: worker(), range(threads)))
+        return total / (time.perf_counter() - started)
@@ -0,0 +1,56 @@
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from events.models import Review
+from events.moderation import Moderator
+
+WORDS = (
+    "great event music venue crowd organised friendly staff sound drinks queue "
+    "speaker talk workshop parking late early loved boring amazing again ticket"
+).split()
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the review moderation scorer on synthetic in-memory reviews "
+        "(a share of them near-duplicate spam); no database access."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reviews", type=int, default=20000)
+        parser.add_argument("--events", type=int, default=200)
+        parser.add_argument("--users", type=int, default=5000)
+        parser.add_argument("--spam-ratio", type=float, default=0.2)
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        rng = random.Random(0)
+        spam = "Best deals on tickets at cheap-tickets example, visit now for discount codes"
+        start = timezone.now() - timedelta(days=1)
+        reviews = []
+        for i in range(options["reviews"]):
+            if rng.random() < options["spam_ratio"]:
+                comment = f"{spam} {rng.randint(0, 99)}"
+            else:
+                comment = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 40)))
+            reviews.append(Review(
+                user_id=rng.randrange(options["users"]), event_id=rng.randrange(options["events"]),
+                rating=rng.randint(1, 5), comment=comment, created_at=start + timedelta(seconds=i),
+            ))
+
+        moderator = Moderator(seed=False)
+        batch_size = options["batch_size"]
+        started = time.perf_counter()
+        for offset in range(0, len(reviews), batch_size):
+            moderator.score(reviews[offset:offset + batch_size])
+        elapsed = time.perf_counter() - started
+
+        pending = sum(review.status == Review.PENDING for review in reviews)
+        self.stdout.write(
+            f"{len(reviews)} reviews in {elapsed:.2f} s ({len(reviews) / elapsed:.0f} reviews/s), "
+            f"{pending} held as pending"
+        )
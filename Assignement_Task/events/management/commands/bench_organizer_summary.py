@@ -0,0 +1,94 @@
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Avg, Count
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from events.models import Event, RSVP, Review
+from events.summary import organizer_summary
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark /api/me/events/summary/ for one organizer against per-event queries. "
+        "Test data is created inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=1000)
+        parser.add_argument("--rsvps-per-event", type=int, default=20)
+        parser.add_argument("--reviews-per-event", type=int, default=5)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                organizer = self._populate(options)
+                self._run("summary (1 statement)", lambda: organizer_summary(organizer), options["repeat"])
+                self._run("per-event queries", lambda: self._per_event(organizer), options["repeat"])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def _populate(self, options):
+        User = get_user_model()
+        tag = f"bench{int(time.time())}"
+        organizer = User.objects.create(username=f"{tag}-organizer")
+        guests = User.objects.bulk_create([
+            User(username=f"{tag}-guest{i}", password="!")
+            for i in range(max(options["rsvps_per_event"], options["reviews_per_event"]))
+        ])
+        now = timezone.now()
+        events = Event.objects.bulk_create([
+            Event(
+                owner=organizer, title=f"Event {i}",
+                start_time=now + timedelta(days=i - options["events"] // 2),
+                end_time=now + timedelta(days=i - options["events"] // 2, hours=2),
+                series_end=now + timedelta(days=i - options["events"] // 2, hours=2),
+            )
+            for i in range(options["events"])
+        ])
+        statuses = [status for status, _ in RSVP.STATUS_CHOICES]
+        RSVP.objects.bulk_create([
+            RSVP(user=guest, event=event, status=random.choice(statuses))
+            for event in events for guest in guests[:options["rsvps_per_event"]]
+        ], batch_size=1000)
+        Review.objects.bulk_create([
+            Review(user=guest, event=event, rating=random.randint(1, 5))
+            for event in events for guest in guests[:options["reviews_per_event"]]
+        ], batch_size=1000)
+        self.stdout.write(
+            f"{options['events']} events, {options['rsvps_per_event']} RSVPs and "
+            f"{options['reviews_per_event']} reviews per event"
+        )
+        return organizer
+
+    def _per_event(self, organizer):
+        """What a client paging through /api/events/ + reviews had to do."""
+        rows = []
+        for event in Event.objects.filter(owner=organizer):
+            rsvps = dict(event.rsvps.order_by().values_list("status").annotate(Count("pk")))
+            reviews = event.reviews.aggregate(count=Count("pk"), average=Avg("rating"))
+            rows.append((event.pk, rsvps, reviews))
+        return rows
+
+    def _run(self, label, fn, repeat):
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                fn()
+                timings.append(time.perf_counter() - started)
+        self.stdout.write(
+            f"{label:<24} best {min(timings) * 1000:8.1f} ms  "
+            f"mean {sum(timings) / len(timings) * 1000:8.1f} ms  queries {len(queries.captured_queries)}"
+        )
@@ -0,0 +1,47 @@
+import json
+import sys
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from events.imports import IMPORT_FORMATS, import_events, iter_rows
+
+
+class Command(BaseCommand):
+    help = "Import events from a CSV, JSON array or JSON lines file (use - for stdin)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--owner", required=True, help="Username that will own the events.")
+        parser.add_argument("--format", choices=IMPORT_FORMATS, help="Defaults to the file extension.")
+        parser.add_argument("--dedup", action="store_true", help="Skip rows whose (owner, title, start_time) exists.")
+        parser.add_argument("--batch-size", type=int, default=settings.EVENT_IMPORT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            owner = User._default_manager.get_by_natural_key(options["owner"])
+        except User.DoesNotExist:
+            raise CommandError(f"Unknown user {options['owner']!r}.")
+
+        path = options["path"]
+        import_format = options["format"] or ("csv" if path.lower().endswith(".csv") else "json")
+        stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+        try:
+            result = import_events(
+                iter_rows(stream, import_format),
+                owner=owner,
+                dedup=options["dedup"],
+                batch_size=options["batch_size"],
+            )
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+
+        for error in result["errors"]:
+            self.stderr.write(f"row {error['row']}: {json.dumps(error['errors'])}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {result['created']} event(s), skipped {len(result['skipped'])} duplicate(s), "
+            f"{len(result['errors'])} row error(s)."
+        ))
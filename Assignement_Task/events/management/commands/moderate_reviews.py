@@ -0,0 +1,34 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from events.models import Review
+from events.moderation import moderate_existing
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-score existing reviews with the moderation heuristics, in creation order, "
+        "and move newly flagged published reviews to pending."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--since-days", type=int, help="Only reviews created in the last N days.")
+        parser.add_argument("--batch-size", type=int, default=settings.REVIEW_MODERATION["BATCH_SIZE"])
+
+    def handle(self, *args, **options):
+        reviews = Review.objects.all()
+        if options["since_days"] is not None:
+            reviews = reviews.filter(created_at__gte=timezone.now() - timedelta(days=options["since_days"]))
+
+        started = time.perf_counter()
+        scored, flagged = moderate_existing(reviews, batch_size=options["batch_size"])
+        elapsed = time.perf_counter() - started
+        rate = scored / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"Scored {scored} review(s), moved {flagged} to pending "
+            f"({elapsed:.2f} s, {rate:.0f} reviews/s)."
+        ))
@@ -0,0 +1,82 @@
+import json
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+class Command(BaseCommand):
+    help = (
+        "Profile cold start in fresh processes: import-time breakdown, boot time, "
+        "first-request latency and peak RSS for one or more settings modules."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "settings_modules", nargs="*",
+            help="Settings modules to compare (default: eventproj.settings eventproj.settings_api).",
+        )
+        parser.add_argument("--path", default="/api/events/", help="Path of the first request.")
+        parser.add_argument("--runs", type=int, default=3, help="Fresh processes per settings module.")
+        parser.add_argument("--top", type=int, default=15, help="Packages to list in the import breakdown.")
+
+    def handle(self, *args, **options):
+        modules = options["settings_modules"] or ["eventproj.settings", "eventproj.settings_api"]
+        summaries = []
+        for module in modules:
+            # -X importtime slows imports down, so it gets a run of its own
+            profiled = self._probe(module, options["path"], importtime=True)
+            self._report_imports(module, profiled["imports"], options["top"])
+            runs = [self._probe(module, options["path"]) for _ in range(max(1, options["runs"]))]
+            for run in runs:
+                run["import_ms"] = profiled["import_ms"]
+            summaries.append((module, runs))
+
+        self.stdout.write(
+            f"\nfirst request: GET {options['path']}  (median of {options['runs']} runs; "
+            f"* import self-time under -X importtime)"
+        )
+        self.stdout.write(
+            f"{'settings':<28} {'status':<8} {'modules':>8} {'imports ms*':>11} {'boot ms':>9} "
+            f"{'1st req ms':>10} {'total ms':>9} {'max RSS MiB':>12}"
+        )
+        for module, runs in summaries:
+            def median(key):
+                return statistics.median(run[key] for run in runs)
+            self.stdout.write(
+                f"{module:<28} {str(runs[-1]['status']).split(' ')[0]:<8} {runs[-1]['modules']:>8} "
+                f"{median('import_ms'):>11.1f} {median('boot_ms'):>9.1f} "
+                f"{median('first_request_ms'):>10.1f} {median('total_ms'):>9.1f} "
+                f"{median('max_rss_kib') / 1024:>12.1f}"
+            )
+
+    def _probe(self, module, path, importtime=False):
+        flags = ["-X", "importtime"] if importtime else []
+        completed = subprocess.run(
+            [sys.executable, *flags, "-m", "eventproj.startup_profile", module, path],
+            cwd=settings.BASE_DIR, capture_output=True, text=True,
+        )
+        if completed.returncode:
+            raise CommandError(f"{module}: probe failed\n{completed.stderr[-2000:]}")
+
+        result = json.loads(completed.stdout)
+        imports = defaultdict(int)
+        for line in completed.stderr.splitlines():
+            match = IMPORTTIME_LINE.match(line)
+            if match:
+                # Self time per top-level package
+                imports[match.group(4).split(".")[0]] += int(match.group(1))
+        result["imports"] = imports
+        result["import_ms"] = sum(imports.values()) / 1000
+        return result
+
+    def _report_imports(self, module, imports, top):
+        self.stdout.write(f"\n{module}: import self-time by top-level package")
+        for package, micros in sorted(imports.items(), key=lambda item: -item[1])[:top]:
+            self.stdout.write(f"  {package:<32} {micros / 1000:8.1f} ms")
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from events.purge import resume_purges
+
+
+class Command(BaseCommand):
+    help = "Finish event deletes that were interrupted before all RSVPs and reviews were purged."
+
+    def handle(self, *args, **options):
+        resumed = resume_purges()
+        self.stdout.write(self.style.SUCCESS(f"Finished {resumed} pending purge(s)."))
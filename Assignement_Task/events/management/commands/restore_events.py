@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from events.archive import restore_events
+
+
+class Command(BaseCommand):
+    help = "Move archived events, with their RSVPs and reviews, back into the hot tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("event_ids", nargs="+", type=int)
+
+    def handle(self, *args, **options):
+        restored = restore_events(options["event_ids"])
+        self.stdout.write(self.style.SUCCESS(f"Restored {restored} event(s)."))
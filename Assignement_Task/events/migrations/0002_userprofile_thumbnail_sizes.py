@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 08:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='thumbnail_sizes',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.9 on 2026-10-19 08:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_series_end(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    Event.objects.filter(recurrence_freq='').update(series_end=models.F('end_time'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_userprofile_thumbnail_sizes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='rsvp',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrence_count',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrence_exdates',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrence_freq',
+            field=models.CharField(blank=True, choices=[('daily', 'Daily'), ('weekly', 'Weekly'), ('monthly', 'Monthly')], default='', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrence_interval',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='recurrence_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='series_end',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(fill_series_end, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='rsvp',
+            name='occurrence_start',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='rsvp',
+            constraint=models.UniqueConstraint(condition=models.Q(('occurrence_start__isnull', True)), fields=('user', 'event'), name='unique_rsvp_per_event'),
+        ),
+        migrations.AddConstraint(
+            model_name='rsvp',
+            constraint=models.UniqueConstraint(condition=models.Q(('occurrence_start__isnull', False)), fields=('user', 'event', 'occurrence_start'), name='unique_rsvp_per_occurrence'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.9 on 2026-10-19 08:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_event_version'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedreview',
+            name='flags',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='archivedreview',
+            name='status',
+            field=models.CharField(choices=[('published', 'Published'), ('pending', 'Pending moderation'), ('rejected', 'Rejected')], default='published', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='flags',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='status',
+            field=models.CharField(choices=[('published', 'Published'), ('pending', 'Pending moderation'), ('rejected', 'Rejected')], default='published', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['event', 'status', 'created_at'], name='review_event_status_idx'),
+        ),
+    ]
@@ -1,6 +1,9 @@
 from django.db import models
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils import timezone
+
+from . import recurrence
 
 User = settings.AUTH_USER_MODEL
 
@@ -14,6 +17,8 @@ class UserProfile(models.Model):
     bio = models.TextField(blank=True)
     location = models.CharField(max_length=255, blank=True)
     profile_picture = models.ImageField(upload_to="profiles/", blank=True, null=True)
+    # Thumbnail sizes already generated for profile_picture (see events.uploads)
+    thumbnail_sizes = models.JSONField(default=list, blank=True)
 
     def __str__(self):
         return self.full_name
@@ -22,6 +27,21 @@ class UserProfile(models.Model):
 # ---------------------------------------------------------
 # 2. EVENT MODEL
 # ---------------------------------------------------------
+class EventQuerySet(models.QuerySet):
+    def overlapping(self, start, end):
+        """Events (or series) with at least part of [start, end) in range."""
+        return self.filter(start_time__lt=end).filter(
+            models.Q(series_end__isnull=True) | models.Q(series_end__gt=start)
+        )
+
+
+class EventManager(models.Manager.from_queryset(EventQuerySet)):
+    """Default manager: hides events that are being purged (see events.purge)."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
 class Event(models.Model):
     owner = models.ForeignKey(User, related_name='events', on_delete=models.CASCADE)
     title = models.CharField(max_length=200)
@@ -31,15 +51,78 @@ class Event(models.Model):
     end_time = models.DateTimeField()
     is_public = models.BooleanField(default=True)
 
+    # Recurrence (RRULE-style); one row per series, see events.recurrence
+    recurrence_freq = models.CharField(
+        max_length=10, choices=recurrence.FREQ_CHOICES, blank=True, default=""
+    )
+    recurrence_interval = models.PositiveSmallIntegerField(default=1)
+    recurrence_until = models.DateTimeField(blank=True, null=True)
+    recurrence_count = models.PositiveIntegerField(blank=True, null=True)
+    recurrence_exdates = models.JSONField(default=list, blank=True)
+    # End of the last occurrence (NULL = open-ended), kept for window queries
+    series_end = models.DateTimeField(blank=True, null=True, db_index=True)
+    # Set when a delete is requested; the row goes once its RSVPs/reviews are purged
+    deleted_at = models.DateTimeField(blank=True, null=True)
+    # Bumped by every write; sent as the ETag for optimistic concurrency
+    version = models.PositiveIntegerField(default=1)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = EventManager()
+    all_objects = EventQuerySet.as_manager()
+
     class Meta:
         ordering = ['-start_time']
+        indexes = [
+            # Public listing: WHERE is_public ORDER BY start_time
+            models.Index(fields=['is_public', 'start_time'], name='event_public_start_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.start_time})"
 
+    def save(self, *args, **kwargs):
+        self.series_end = recurrence.series_end(self)
+        if not self._state.adding:
+            self.version += 1
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "series_end", "version"}
+        super().save(*args, **kwargs)
+
+    def conditional_update(self, fields, versions):
+        """
+        Write ``fields`` (plus the derived series_end/updated_at) with
+        ``UPDATE ... WHERE version = v`` for each of ``versions`` in turn
+        instead of a full save. ``versions=None`` writes over the current
+        version, read first and retried if another write lands in between.
+        Either way ``self.version`` becomes the version this write produced.
+        Returns False, writing nothing, if no listed version is current (or
+        the row is gone).
+        """
+        self.series_end = recurrence.series_end(self)
+        self.updated_at = timezone.now()
+        values = {name: getattr(self, name) for name in {*fields, "series_end", "updated_at"}}
+        if versions is not None:
+            return any(self._update_version(version, values) for version in versions)
+        while True:
+            current = Event.objects.filter(pk=self.pk).values_list("version", flat=True).first()
+            if current is None:
+                return False
+            if self._update_version(current, values):
+                return True
+
+    def _update_version(self, version, values):
+        if not Event.objects.filter(pk=self.pk, version=version).update(version=version + 1, **values):
+            return False
+        self.version = version + 1
+        return True
+
+    def occurrences(self, start=None, end=None):
+        """Lazily yield this event's occurrences overlapping [start, end)."""
+        return recurrence.iter_occurrences(self, start, end)
+
 
 # ---------------------------------------------------------
 # 3. RSVP MODEL
@@ -58,11 +141,24 @@ class RSVP(models.Model):
     user = models.ForeignKey(User, related_name='rsvps', on_delete=models.CASCADE)
     event = models.ForeignKey(Event, related_name='rsvps', on_delete=models.CASCADE)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=MAYBE)
+    # Start of the occurrence for recurring events; NULL = the event/series
+    occurrence_start = models.DateTimeField(blank=True, null=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        unique_together = ('user', 'event')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'event'],
+                condition=models.Q(occurrence_start__isnull=True),
+                name='unique_rsvp_per_event',
+            ),
+            models.UniqueConstraint(
+                fields=['user', 'event', 'occurrence_start'],
+                condition=models.Q(occurrence_start__isnull=False),
+                name='unique_rsvp_per_occurrence',
+            ),
+        ]
         ordering = ['-created_at']
 
     def __str__(self):
@@ -73,17 +169,124 @@ class RSVP(models.Model):
 # 4. REVIEW MODEL
 # ---------------------------------------------------------
 class Review(models.Model):
+    PUBLISHED = 'published'
+    PENDING = 'pending'
+    REJECTED = 'rejected'
+
+    STATUS_CHOICES = [
+        (PUBLISHED, 'Published'),
+        (PENDING, 'Pending moderation'),
+        (REJECTED, 'Rejected'),
+    ]
+
     user = models.ForeignKey(User, related_name='reviews', on_delete=models.CASCADE)
     event = models.ForeignKey(Event, related_name='reviews', on_delete=models.CASCADE)
     rating = models.PositiveSmallIntegerField(
         validators=[MinValueValidator(1), MaxValueValidator(5)]
     )
     comment = models.TextField(blank=True)
+    # Only published reviews are listed and rated; see events.moderation
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PUBLISHED)
+    flags = models.JSONField(default=list, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         unique_together = ('user', 'event')  # User can review event only once
         ordering = ['-created_at']
+        indexes = [
+            # Event review list / moderation queue: WHERE event AND status ORDER BY created_at
+            models.Index(fields=['event', 'status', 'created_at'], name='review_event_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user} rated {self.event} => {self.rating}"
+
+
+# ---------------------------------------------------------
+# 5. EVENT PURGE (BATCHED DELETE PROGRESS)
+# ---------------------------------------------------------
+class EventPurge(models.Model):
+    """Progress of an asynchronous, batched event delete (see events.purge)."""
+    # Plain id: the event row is gone once the purge finishes
+    event_id = models.BigIntegerField(unique=True)
+    title = models.CharField(max_length=200)
+    requested_by = models.ForeignKey(
+        User, related_name='event_purges', on_delete=models.SET_NULL, null=True
+    )
+    rsvps_deleted = models.PositiveIntegerField(default=0)
+    reviews_deleted = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        state = "done" if self.finished_at else "running"
+        return f"purge of {self.title} ({self.event_id}): {state}"
+
+
+# ---------------------------------------------------------
+# 6. ARCHIVE MODELS
+# ---------------------------------------------------------
+# Cold tier for events whose series ended before ARCHIVE_HORIZON_DAYS, see
+# events.archive. Rows keep their original primary keys so they can be
+# restored, and related names match the hot models so the same serializers
+# and permissions work on both tiers.
+class ArchivedEvent(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    owner = models.ForeignKey(User, related_name='archived_events', on_delete=models.CASCADE)
+    title = models.CharField(max_length=200)
+    description = models.TextField(blank=True)
+    location = models.CharField(max_length=255, blank=True)
+    start_time = models.DateTimeField()
+    end_time = models.DateTimeField()
+    is_public = models.BooleanField(default=True)
+
+    recurrence_freq = models.CharField(
+        max_length=10, choices=recurrence.FREQ_CHOICES, blank=True, default=""
+    )
+    recurrence_interval = models.PositiveSmallIntegerField(default=1)
+    recurrence_until = models.DateTimeField(blank=True, null=True)
+    recurrence_count = models.PositiveIntegerField(blank=True, null=True)
+    recurrence_exdates = models.JSONField(default=list, blank=True)
+    series_end = models.DateTimeField(blank=True, null=True)
+    version = models.PositiveIntegerField(default=1)
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-start_time']
+
+    def __str__(self):
+        return f"{self.title} ({self.start_time}) [archived]"
+
+
+class ArchivedRSVP(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, related_name='archived_rsvps', on_delete=models.CASCADE)
+    event = models.ForeignKey(ArchivedEvent, related_name='rsvps', on_delete=models.CASCADE)
+    status = models.CharField(max_length=20, choices=RSVP.STATUS_CHOICES, default=RSVP.MAYBE)
+    occurrence_start = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-created_at']
+
+
+class ArchivedReview(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, related_name='archived_reviews', on_delete=models.CASCADE)
+    event = models.ForeignKey(ArchivedEvent, related_name='reviews', on_delete=models.CASCADE)
+    rating = models.PositiveSmallIntegerField(
+        validators=[MinValueValidator(1), MaxValueValidator(5)]
+    )
+    comment = models.TextField(blank=True)
+    status = models.CharField(max_length=20, choices=Review.STATUS_CHOICES, default=Review.PUBLISHED)
+    flags = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-created_at']
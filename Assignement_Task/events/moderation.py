@@ -0,0 +1,293 @@
+"""
+Review moderation: cheap local spam heuristics applied before a review is
+saved.
+
+Each comment is reduced to a bottom-k MinHash sketch of its character
+shingles and looked up, through an inverted index, against the recent
+reviews of the same event; an estimated Jaccard similarity of at least
+REVIEW_MODERATION["DUPLICATE_THRESHOLD"] flags it as a near-duplicate.
+Users posting more than RATE_LIMIT reviews within RATE_WINDOW_SECONDS are
+flagged as well. Flagged reviews are saved as pending instead of published
+and wait in the admin moderation queue.
+
+The index lives in process memory and is updated incrementally: every
+scored review is added, the oldest drop out beyond RECENT_PER_EVENT per
+event, and events and users are evicted least recently used. An event or
+user is seeded from the database the first time a process sees it, with
+one query per batch.
+"""
+import re
+import threading
+import zlib
+from collections import Counter, OrderedDict, deque
+from itertools import chain
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from .caching import invalidate_event
+from .models import Review
+
+# Flags stored on Review.flags
+DUPLICATE = "duplicate"
+RATE = "rate"
+
+_NON_WORD = re.compile(r"\W+")
+
+
+# ---------------------------------------------------------
+# 1. MINHASH SKETCHES
+# ---------------------------------------------------------
+def sketch(text, shingle_size, size):
+    """
+    Bottom-``size`` MinHash sketch of the shingles (``shingle_size`` UTF-8
+    bytes) of ``text`` with case and punctuation ignored, or None if it is
+    too short to shingle.
+    """
+    data = _NON_WORD.sub(" ", text.lower()).strip().encode()
+    if len(data) < shingle_size:
+        return None
+    hashes = set(map(zlib.crc32, (data[i:i + shingle_size] for i in range(len(data) - shingle_size + 1))))
+    return frozenset(sorted(hashes)[:size])
+
+
+def similarity(a, b, size):
+    """Jaccard similarity of two texts estimated from their sketches."""
+    union = sorted(a | b)[:size]
+    return sum(1 for value in union if value in a and value in b) / len(union)
+
+
+class _EventIndex:
+    """Sketches of one event's most recent reviews, plus an inverted index."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.sketches = {}  # entry id -> sketch, oldest first
+        self.postings = {}  # hash value -> entry ids
+
+    def add(self, entry_id, entry):
+        self.sketches[entry_id] = entry
+        for value in entry:
+            self.postings.setdefault(value, set()).add(entry_id)
+        if len(self.sketches) > self.capacity:
+            oldest = next(iter(self.sketches))
+            for value in self.sketches.pop(oldest):
+                ids = self.postings[value]
+                ids.discard(oldest)
+                if not ids:
+                    del self.postings[value]
+
+    def near_duplicate(self, entry, threshold, size):
+        postings = self.postings
+        shared = Counter(chain.from_iterable(postings[value] for value in entry if value in postings))
+        # A similar sketch must share at least threshold * len(entry) values
+        needed = threshold * len(entry)
+        return any(
+            count >= needed and similarity(entry, self.sketches[entry_id], size) >= threshold
+            for entry_id, count in shared.items()
+        )
+
+
+# ---------------------------------------------------------
+# 2. MODERATOR
+# ---------------------------------------------------------
+class Moderator:
+    """
+    Scores reviews against an in-memory index of recent reviews.
+
+    With ``seed`` (the request path) unseen events and users are loaded from
+    the database first; batch re-scoring starts empty and replays reviews in
+    creation order instead.
+    """
+
+    def __init__(self, seed=True, **overrides):
+        self.config = {**settings.REVIEW_MODERATION, **overrides}
+        self.seed = seed
+        self.window = timedelta(seconds=self.config["RATE_WINDOW_SECONDS"])
+        self._lock = threading.Lock()
+        self._events = OrderedDict()  # event id -> _EventIndex
+        self._users = OrderedDict()   # user id -> review times, oldest first
+        self._next_id = 0
+
+    def score(self, reviews, record=True):
+        """
+        Set ``status`` and ``flags`` on each of ``reviews``, scored in order.
+        With ``record`` each one is also added to the index straight away
+        (batch mode); otherwise call record() once the review is saved.
+        Returns the reviews.
+        """
+        now = timezone.now()
+        if self.seed:
+            self._seed(reviews, now)
+        with self._lock:
+            for review in reviews:
+                at = review.created_at or now
+                entry = self._flag(review, at)
+                if record:
+                    self._record(review, at, entry)
+        return reviews
+
+    def record(self, reviews):
+        """Add reviews scored with ``record=False`` to the index."""
+        now = timezone.now()
+        with self._lock:
+            for review in reviews:
+                self._record(review, review.created_at or now, self._sketch(review.comment))
+
+    def clear(self):
+        """Forget every indexed review and user."""
+        with self._lock:
+            self._events.clear()
+            self._users.clear()
+
+    def _flag(self, review, at):
+        """Set status/flags on ``review`` without indexing it; returns its sketch."""
+        config = self.config
+        flags = []
+
+        times = self._lru(self._users, review.user_id, deque, config["MAX_USERS"])
+        while times and times[0] <= at - self.window:
+            times.popleft()
+        if len(times) >= config["RATE_LIMIT"]:
+            flags.append(RATE)
+
+        index = self._event_index(review.event_id)
+        entry = self._sketch(review.comment)
+        if entry is not None and index.near_duplicate(
+            entry, config["DUPLICATE_THRESHOLD"], config["SKETCH_SIZE"]
+        ):
+            flags.append(DUPLICATE)
+
+        review.flags = flags
+        review.status = Review.PENDING if flags else Review.PUBLISHED
+        return entry
+
+    def _record(self, review, at, entry):
+        self._lru(self._users, review.user_id, deque, self.config["MAX_USERS"]).append(at)
+        if entry is not None:
+            self._add(self._event_index(review.event_id), entry)
+
+    def _sketch(self, comment):
+        # Short comments ("Great event!") legitimately repeat
+        if len(comment.strip()) < self.config["MIN_CHARS"]:
+            return None
+        return sketch(comment, self.config["SHINGLE_SIZE"], self.config["SKETCH_SIZE"])
+
+    def _add(self, index, entry):
+        index.add(self._next_id, entry)
+        self._next_id += 1
+
+    def _event_index(self, event_id):
+        capacity = self.config["RECENT_PER_EVENT"]
+        return self._lru(self._events, event_id, lambda: _EventIndex(capacity), self.config["MAX_EVENTS"])
+
+    @staticmethod
+    def _lru(table, key, factory, limit):
+        if key in table:
+            table.move_to_end(key)
+            return table[key]
+        table[key] = value = factory()
+        if len(table) > limit:
+            table.popitem(last=False)
+        return value
+
+    def _seed(self, reviews, now):
+        """Load recent reviews for events and users this process has not seen."""
+        with self._lock:
+            events = {r.event_id for r in reviews} - self._events.keys()
+            users = {r.user_id for r in reviews} - self._users.keys()
+
+        comments = []
+        if events:
+            comments = list(
+                Review.objects.filter(event_id__in=events)
+                .annotate(position=Window(
+                    RowNumber(), partition_by=F("event_id"), order_by=F("created_at").desc(),
+                ))
+                .filter(position__lte=self.config["RECENT_PER_EVENT"])
+                .order_by("created_at")
+                .values_list("event_id", "comment")
+            )
+        times = []
+        if users:
+            times = list(
+                Review.objects.filter(user_id__in=users, created_at__gt=now - self.window)
+                .order_by("created_at")
+                .values_list("user_id", "created_at")
+            )
+
+        with self._lock:
+            # Another thread may have seeded (and since updated) some of them
+            events -= self._events.keys()
+            users -= self._users.keys()
+            indexes = {event_id: self._event_index(event_id) for event_id in events}
+            timelines = {
+                user_id: self._lru(self._users, user_id, deque, self.config["MAX_USERS"])
+                for user_id in users
+            }
+            for event_id, comment in comments:
+                entry = self._sketch(comment)
+                if event_id in indexes and entry is not None:
+                    self._add(indexes[event_id], entry)
+            for user_id, created_at in times:
+                if user_id in timelines:
+                    timelines[user_id].append(created_at)
+
+
+_moderator = None
+_moderator_lock = threading.Lock()
+
+
+def moderator():
+    """The process-wide moderator used on the request path."""
+    global _moderator
+    with _moderator_lock:
+        if _moderator is None:
+            _moderator = Moderator()
+        return _moderator
+
+
+# ---------------------------------------------------------
+# 3. BATCH RE-SCORING
+# ---------------------------------------------------------
+def moderate_existing(reviews=None, batch_size=None):
+    """
+    Re-score ``reviews`` (default: all) in creation order with a fresh index
+    and move newly flagged published ones to pending. Returns
+    ``(scored, flagged)``.
+    """
+    batch_size = batch_size or settings.REVIEW_MODERATION["BATCH_SIZE"]
+    reviews = (Review.objects.all() if reviews is None else reviews).order_by("created_at", "pk")
+    fresh = Moderator(seed=False)
+    scored = flagged = 0
+    batch = []
+
+    def flush():
+        nonlocal scored, flagged
+        original = [review.status for review in batch]
+        fresh.score(batch)
+        # Only demote published reviews; pending/rejected ones stay as they are
+        changed = [
+            review for review, status in zip(batch, original)
+            if status == Review.PUBLISHED and review.status == Review.PENDING
+        ]
+        with transaction.atomic():
+            Review.objects.bulk_update(changed, ["status", "flags"])
+            # bulk_update sends no post_save, so drop cached review pages/ratings here
+            for event_id in {review.event_id for review in changed}:
+                invalidate_event(event_id)
+        scored += len(batch)
+        flagged += len(changed)
+        batch.clear()
+
+    for review in reviews.only("pk", "user_id", "event_id", "comment", "status", "created_at").iterator(batch_size):
+        batch.append(review)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return scored, flagged
@@ -0,0 +1,77 @@
+"""
+Asynchronous, batched deletion of events.
+
+Deleting an event through Django's collector loads every RSVP and review and
+removes them in one long transaction. Instead, request_event_purge() only
+hides the event (``deleted_at``) and records an ``EventPurge``; purge_event()
+then deletes dependents EVENT_PURGE_BATCH_SIZE rows at a time, each batch in
+its own short transaction, so memory and writer-lock time stay flat however
+many dependents there are.
+"""
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from . import background
+from .caching import invalidate_event
+from .models import Event, EventPurge, Review, RSVP
+
+# Dependent model -> EventPurge progress counter
+DEPENDENTS = [
+    (RSVP, "rsvps_deleted"),
+    (Review, "reviews_deleted"),
+]
+
+
+def request_event_purge(event, user=None):
+    """Hide ``event`` now and schedule the purge once the hide commits."""
+    with transaction.atomic():
+        Event.all_objects.filter(pk=event.pk).update(deleted_at=timezone.now())
+        invalidate_event(event.pk)
+        purge, _ = EventPurge.objects.get_or_create(
+            event_id=event.pk,
+            defaults={"title": event.title, "requested_by": user},
+        )
+        transaction.on_commit(lambda: schedule_purge(event.pk))
+    return purge
+
+
+def schedule_purge(event_id):
+    return background.submit("EVENT_PURGE_WORKERS", purge_event, event_id)
+
+
+def purge_event(event_id, batch_size=None):
+    """
+    Delete the dependents of a hidden event in bounded batches, then the
+    event itself. Safe to re-run after an interruption.
+    """
+    batch_size = batch_size or settings.EVENT_PURGE_BATCH_SIZE
+
+    for model, counter in DEPENDENTS:
+        while True:
+            with transaction.atomic():
+                ids = list(
+                    model.objects.filter(event_id=event_id)
+                    .order_by("pk")
+                    .values_list("pk", flat=True)[:batch_size]
+                )
+                if not ids:
+                    break
+                # No signals or cascades below RSVP/Review: one DELETE per batch
+                deleted, _ = model.objects.filter(pk__in=ids).delete()
+                EventPurge.objects.filter(event_id=event_id).update(**{counter: F(counter) + deleted})
+
+    with transaction.atomic():
+        Event.all_objects.filter(pk=event_id, deleted_at__isnull=False).delete()
+        EventPurge.objects.filter(event_id=event_id).update(finished_at=timezone.now())
+
+
+def resume_purges():
+    """Finish purges interrupted by a restart. Returns how many ran."""
+    pending = list(
+        EventPurge.objects.filter(finished_at__isnull=True).values_list("event_id", flat=True)
+    )
+    for event_id in pending:
+        purge_event(event_id)
+    return len(pending)
@@ -0,0 +1,168 @@
+"""
+Lazy expansion of recurring events.
+
+A recurring ``Event`` stores one row for the whole series: its first
+``start_time``/``end_time`` plus an RRULE-style rule (``recurrence_freq``,
+``recurrence_interval``, ``recurrence_until`` or ``recurrence_count``) and a
+list of cancelled occurrence starts in ``recurrence_exdates``. Occurrences are
+produced by generators, only for the requested window, and never stored.
+"""
+import calendar
+import heapq
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+DAILY = "daily"
+WEEKLY = "weekly"
+MONTHLY = "monthly"
+
+FREQ_CHOICES = [
+    (DAILY, "Daily"),
+    (WEEKLY, "Weekly"),
+    (MONTHLY, "Monthly"),
+]
+
+Occurrence = namedtuple("Occurrence", ["event", "start", "end"])
+
+
+def _add_months(dt, months):
+    """``dt`` shifted by ``months``, or None if that month lacks the day."""
+    index = dt.month - 1 + months
+    year, month = dt.year + index // 12, index % 12 + 1
+    if dt.day > calendar.monthrange(year, month)[1]:
+        return None
+    return dt.replace(year=year, month=month)
+
+
+def _step(event):
+    """Distance between consecutive starts of a daily or weekly series."""
+    days = 7 if event.recurrence_freq == WEEKLY else 1
+    return timedelta(days=days * (event.recurrence_interval or 1))
+
+
+def _months_between(earlier, later):
+    return (later.year - earlier.year) * 12 + later.month - earlier.month
+
+
+def iter_starts(event, after=None):
+    """
+    Yield the start of every occurrence in the series, in order.
+
+    ``after`` lets the generator jump straight to the first start that can
+    still overlap it instead of walking the series from the beginning.
+    Exceptions and ``recurrence_until`` are applied by iter_occurrences().
+    """
+    start = event.start_time
+    if not event.recurrence_freq:
+        yield start
+        return
+
+    interval = event.recurrence_interval or 1
+    count = event.recurrence_count
+    earliest = after - (event.end_time - start) if after is not None else None
+
+    if event.recurrence_freq in (DAILY, WEEKLY):
+        step = _step(event)
+        k = max(0, (earliest - start) // step) if earliest is not None else 0
+        while count is None or k < count:
+            try:
+                occurrence = start + k * step
+            except OverflowError:
+                # Open-ended series run into datetime.max eventually
+                return
+            yield occurrence
+            k += 1
+        return
+
+    # Monthly: months without the start day are skipped (RFC 5545), so with a
+    # COUNT the series has to be walked to know how many were generated.
+    k = 0
+    if earliest is not None and count is None:
+        k = max(0, _months_between(start, earliest) // interval - 1)
+    generated = 0
+    while count is None or generated < count:
+        try:
+            occurrence = _add_months(start, k * interval)
+        except ValueError:
+            # Past year 9999
+            return
+        k += 1
+        if occurrence is None:
+            continue
+        generated += 1
+        yield occurrence
+
+
+def iter_occurrences(event, start=None, end=None):
+    """
+    Yield the ``Occurrence`` objects of ``event`` overlapping ``[start, end)``.
+
+    Either bound may be None; without ``end`` an open-ended series yields
+    forever, so callers must stop consuming.
+    """
+    duration = event.end_time - event.start_time
+    exdates = {datetime.fromisoformat(d) for d in event.recurrence_exdates or ()}
+    until = event.recurrence_until
+
+    for occurrence_start in iter_starts(event, start):
+        if until is not None and occurrence_start > until:
+            return
+        if end is not None and occurrence_start >= end:
+            return
+        occurrence_end = occurrence_start + duration
+        if start is not None and occurrence_end <= start and occurrence_start < start:
+            continue
+        if occurrence_start in exdates:
+            continue
+        yield Occurrence(event, occurrence_start, occurrence_end)
+
+
+def merge_occurrences(events, start=None, end=None):
+    """Lazily merge the occurrences of several events by start time."""
+    return heapq.merge(
+        *(iter_occurrences(event, start, end) for event in events),
+        key=lambda occurrence: occurrence.start,
+    )
+
+
+def is_occurrence(event, when):
+    """True if ``when`` is the start of a (non-cancelled) occurrence."""
+    return any(
+        occurrence.start == when
+        for occurrence in iter_occurrences(event, when, when + timedelta(microseconds=1))
+    )
+
+
+def series_end(event):
+    """
+    End of the last occurrence, or None for an open-ended series. Daily and
+    weekly series are computed directly; monthly ones are walked, which
+    EventSerializer bounds through the count/until caps. Raises
+    OverflowError when the series would end past ``datetime.max``.
+    """
+    if not event.recurrence_freq:
+        return event.end_time
+    count, until = event.recurrence_count, event.recurrence_until
+    if count is None and until is None:
+        return None
+    duration = event.end_time - event.start_time
+
+    if event.recurrence_freq in (DAILY, WEEKLY):
+        step = _step(event)
+        last = count - 1 if count is not None else None
+        if until is not None:
+            # Floor division of a negative span gives -1: no occurrence at all
+            last_until = (until - event.start_time) // step
+            last = last_until if last is None else min(last, last_until)
+        if last < 0:
+            return event.end_time
+        return event.start_time + last * step + duration
+
+    last = None
+    for occurrence_start in iter_starts(event):
+        if event.recurrence_until is not None and occurrence_start > event.recurrence_until:
+            break
+        last = occurrence_start
+    if last is None:
+        return event.end_time
+    return last + duration
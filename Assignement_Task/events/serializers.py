@@ -1,6 +1,15 @@
+from datetime import timedelta, timezone
+
 from rest_framework import serializers
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from .models import Event, RSVP, Review, UserProfile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from .concurrency import ANY, PreconditionFailed
+from .models import ArchivedEvent, Event, EventPurge, RSVP, Review, UserProfile
+from .moderation import moderator
+from .recurrence import is_occurrence, series_end
+from .uploads import pick_thumbnail_size, thumbnail_name
 
 User = get_user_model()
 
@@ -9,10 +18,36 @@ User = get_user_model()
 # USER PROFILE SERIALIZER
 # -----------------------------
 class UserProfileSerializer(serializers.ModelSerializer):
+    profile_picture = serializers.SerializerMethodField()
+
     class Meta:
         model = UserProfile
         fields = ["full_name", "bio", "location", "profile_picture"]
 
+    def get_profile_picture(self, obj):
+        """
+        URL of the smallest thumbnail covering ``?picture_size=`` (default
+        PROFILE_PICTURE_DEFAULT_SIZE); the original when none is large enough
+        or ``?picture_size=original`` is passed.
+        """
+        if not obj.profile_picture:
+            return None
+
+        request = self.context.get("request")
+        wanted = request.query_params.get("picture_size") if request else None
+        name = obj.profile_picture.name
+        if wanted != "original":
+            try:
+                wanted = int(wanted)
+            except (TypeError, ValueError):
+                wanted = settings.PROFILE_PICTURE_DEFAULT_SIZE
+            size = pick_thumbnail_size(obj.thumbnail_sizes, wanted)
+            if size is not None:
+                name = thumbnail_name(name, size)
+
+        url = default_storage.url(name)
+        return request.build_absolute_uri(url) if request else url
+
 
 # -----------------------------
 # USER SERIALIZER
@@ -32,18 +67,97 @@ class EventSerializer(serializers.ModelSerializer):
     owner = UserSerializer(read_only=True)
     rsvp_count = serializers.IntegerField(source="rsvps.count", read_only=True)
     average_rating = serializers.SerializerMethodField()
+    recurrence_exdates = serializers.ListField(
+        child=serializers.DateTimeField(), required=False
+    )
+    is_archived = serializers.SerializerMethodField()
 
     class Meta:
         model = Event
         fields = [
             "id", "owner", "title", "description", "location",
             "start_time", "end_time", "is_public",
-            "created_at", "updated_at",
-            "rsvp_count", "average_rating"
+            "recurrence_freq", "recurrence_interval", "recurrence_until",
+            "recurrence_count", "recurrence_exdates",
+            "created_at", "updated_at", "version",
+            "rsvp_count", "average_rating", "is_archived"
         ]
+        read_only_fields = ["version"]
+
+    def validate(self, attrs):
+        def current(field, default=None):
+            return attrs.get(field, getattr(self.instance, field, default))
+
+        recurring = bool(current("recurrence_freq"))
+        if current("recurrence_until") and current("recurrence_count"):
+            raise serializers.ValidationError(
+                "Set either recurrence_until or recurrence_count, not both."
+            )
+        if not recurring and (
+            current("recurrence_until") or current("recurrence_count") or current("recurrence_exdates")
+        ):
+            raise serializers.ValidationError(
+                {"recurrence_freq": ["Required when a recurrence rule is given."]}
+            )
+        if current("recurrence_interval", 1) < 1:
+            raise serializers.ValidationError(
+                {"recurrence_interval": ["Must be at least 1."]}
+            )
+        count = current("recurrence_count")
+        if count is not None and not 1 <= count <= settings.RECURRENCE_MAX_COUNT:
+            raise serializers.ValidationError(
+                {"recurrence_count": [f"Must be between 1 and {settings.RECURRENCE_MAX_COUNT}."]}
+            )
+        if recurring and current("start_time") and current("end_time"):
+            self.check_series_span(current)
+        if "recurrence_exdates" in attrs:
+            # Stored as ISO strings in a JSONField
+            attrs["recurrence_exdates"] = sorted(
+                d.astimezone(timezone.utc).isoformat() for d in attrs["recurrence_exdates"]
+            )
+        return attrs
+
+    def check_series_span(self, current):
+        """Reject rules whose last occurrence starts too far out (or past year 9999)."""
+        span = timedelta(days=settings.RECURRENCE_MAX_SPAN_DAYS)
+        message = f"Must end within {settings.RECURRENCE_MAX_SPAN_DAYS} days of start_time."
+        until = current("recurrence_until")
+        if until is not None and until - current("start_time") > span:
+            raise serializers.ValidationError({"recurrence_until": [message]})
+
+        candidate = Event(**{
+            field: current(field)
+            for field in ("start_time", "end_time", "recurrence_freq", "recurrence_until", "recurrence_count")
+        }, recurrence_interval=current("recurrence_interval", 1))
+        try:
+            end = series_end(candidate)
+            # series_end - end_time is the offset of the last occurrence's start
+            too_long = end is not None and end - current("end_time") > span
+        except OverflowError:
+            too_long = True
+        if too_long:
+            raise serializers.ValidationError({"recurrence_count": [message]})
+
+    def update(self, instance, validated_data):
+        """
+        Write only the submitted fields, conditioned on the versions in the
+        view's ``if_match`` context (any current one for ``*``, else the
+        version just read).
+        """
+        if_match = self.context.get("if_match")
+        versions = None if if_match == ANY else if_match or [instance.version]
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+        if not instance.conditional_update(validated_data, versions):
+            raise PreconditionFailed()
+        return instance
+
+    def get_is_archived(self, obj):
+        # ArchivedEvent rows are served through this serializer too
+        return isinstance(obj, ArchivedEvent)
 
     def get_average_rating(self, obj):
-        ratings = obj.reviews.all().values_list("rating", flat=True)
+        ratings = obj.reviews.filter(status=Review.PUBLISHED).values_list("rating", flat=True)
         return round(sum(ratings) / len(ratings), 2) if ratings else None
 
     # def create(self, validated_data):
@@ -59,19 +173,87 @@ class RSVPSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = RSVP
-        fields = ["id", "user", "event", "status", "created_at"]
+        fields = ["id", "user", "event", "occurrence_start", "status", "created_at"]
         read_only_fields = ["event"]
 
+    def validate(self, attrs):
+        event = self.context.get("event") or getattr(self.instance, "event", None)
+        # An existing RSVP keeps its occurrence unless the update moves it, so
+        # RSVPs made before the organizer changed the rule can still be edited
+        if event is None or (self.instance is not None and "occurrence_start" not in attrs):
+            return attrs
+
+        occurrence_start = attrs.get("occurrence_start")
+        if not event.recurrence_freq:
+            if occurrence_start is not None:
+                raise serializers.ValidationError(
+                    {"occurrence_start": ["This event does not recur."]}
+                )
+        elif occurrence_start is None:
+            raise serializers.ValidationError(
+                {"occurrence_start": ["Required for recurring events."]}
+            )
+        elif not is_occurrence(event, occurrence_start):
+            raise serializers.ValidationError(
+                {"occurrence_start": ["Not an occurrence of this event."]}
+            )
+        return attrs
+
     def create(self, validated_data):
         user = self.context["request"].user
         event = self.context["event"]
         rsvp, created = RSVP.objects.update_or_create(
             user=user,
             event=event,
+            occurrence_start=validated_data.pop("occurrence_start", None),
             defaults=validated_data,  # e.g. {"status": "attending"}
         )
         return rsvp
 
+
+# -----------------------------
+# EVENT PURGE SERIALIZER
+# -----------------------------
+class EventPurgeSerializer(serializers.ModelSerializer):
+    status = serializers.SerializerMethodField()
+
+    class Meta:
+        model = EventPurge
+        fields = [
+            "event_id", "title", "status", "rsvps_deleted", "reviews_deleted",
+            "created_at", "finished_at",
+        ]
+
+    def get_status(self, obj):
+        return "done" if obj.finished_at else "running"
+
+
+# -----------------------------
+# OCCURRENCE SERIALIZERS
+# -----------------------------
+class OccurrenceWindowSerializer(serializers.Serializer):
+    """Query parameters of the occurrence (calendar) listing."""
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+    limit = serializers.IntegerField(min_value=1, max_value=500, default=100)
+
+    def validate(self, attrs):
+        if attrs["end"] <= attrs["start"]:
+            raise serializers.ValidationError({"end": ["Must be after start."]})
+        if attrs["end"] - attrs["start"] > timedelta(days=settings.OCCURRENCE_WINDOW_MAX_DAYS):
+            raise serializers.ValidationError(
+                {"end": [f"Window may span at most {settings.OCCURRENCE_WINDOW_MAX_DAYS} days."]}
+            )
+        return attrs
+
+
+class OccurrenceSerializer(serializers.Serializer):
+    event = serializers.IntegerField(source="event.id")
+    title = serializers.CharField(source="event.title")
+    location = serializers.CharField(source="event.location")
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+
 # -----------------------------
 # REVIEW SERIALIZER
 # -----------------------------
@@ -80,15 +262,22 @@ class ReviewSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Review
-        fields = ["id", "user", "event", "rating", "comment", "created_at"]
-        read_only_fields = ["event"]
+        fields = ["id", "user", "event", "rating", "comment", "status", "created_at"]
+        read_only_fields = ["event", "status"]
 
     def create(self, validated_data):
         user = self.context["request"].user
         event = self.context["event"]
-        return Review.objects.create(user=user, event=event, **validated_data)
+        review = Review(user=user, event=event, **validated_data)
+        # In-memory scoring; suspicious reviews are saved as pending. The
+        # index only learns about the review once its row is committed.
+        moderator().score([review], record=False)
+        review.save()
+        transaction.on_commit(lambda: moderator().record([review]))
+        return review
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from .hashers import make_password_pooled
 
 User = get_user_model()
 
@@ -101,7 +290,11 @@ class RegisterSerializer(serializers.ModelSerializer):
         fields = ["id", "username", "email", "password"]
 
     def create(self, validated_data):
-        # Use create_user so password is hashed
+        # Same normalisation as create_user, but the hash runs on the pool
         password = validated_data.pop("password")
-        user = User.objects.create_user(password=password, **validated_data)
+        validated_data["username"] = User.normalize_username(validated_data["username"])
+        validated_data["email"] = User.objects.normalize_email(validated_data.get("email", ""))
+        user = User(**validated_data)
+        user.password = make_password_pooled(password)
+        user.save()
         return user
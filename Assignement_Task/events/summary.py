@@ -0,0 +1,80 @@
+"""
+Organizer dashboard: per-event RSVP/review statistics for one owner.
+
+Everything comes from one SQL statement. Each statistic is a correlated
+scalar subquery instead of a JOIN + GROUP BY over both RSVPs and reviews,
+which would multiply the two sets of rows for popular events.
+"""
+from django.db.models import Avg, Count, FloatField, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Event, RSVP, Review
+
+
+def _per_event(model, aggregate, output_field, **filters):
+    return Subquery(
+        model.objects.filter(event=OuterRef("pk"), **filters)
+        .order_by()
+        .values("event")
+        .annotate(value=aggregate)
+        .values("value"),
+        output_field=output_field,
+    )
+
+
+def events_with_stats(owner):
+    """The owner's events annotated with RSVP counts by status and review stats."""
+    rsvp_counts = {
+        f"rsvps_{status}": Coalesce(
+            _per_event(RSVP, Count("pk"), IntegerField(), status=status), Value(0)
+        )
+        for status, _ in RSVP.STATUS_CHOICES
+    }
+    return (
+        Event.objects.filter(owner=owner)
+        .order_by("start_time")
+        .annotate(
+            **rsvp_counts,
+            review_count=Coalesce(
+                _per_event(Review, Count("pk"), IntegerField(), status=Review.PUBLISHED), Value(0)
+            ),
+            average_rating=_per_event(Review, Avg("rating"), FloatField(), status=Review.PUBLISHED),
+        )
+    )
+
+
+def next_occurrence(event, now):
+    """Start of the next occurrence at or after ``now``, or None."""
+    return next(
+        (o.start for o in event.occurrences(now) if o.start >= now),
+        None,
+    )
+
+
+def organizer_summary(owner, now=None):
+    """Dashboard payload: one entry per event plus totals across them."""
+    now = now or timezone.now()
+    statuses = [status for status, _ in RSVP.STATUS_CHOICES]
+    totals = {"events": 0, "rsvps": dict.fromkeys(statuses, 0), "review_count": 0}
+    events = []
+
+    for event in events_with_stats(owner):
+        rsvps = {status: getattr(event, f"rsvps_{status}") for status in statuses}
+        events.append({
+            "id": event.id,
+            "title": event.title,
+            "is_public": event.is_public,
+            "rsvps": rsvps,
+            "review_count": event.review_count,
+            "average_rating": (
+                round(event.average_rating, 2) if event.average_rating is not None else None
+            ),
+            "next_occurrence": next_occurrence(event, now),
+        })
+        totals["events"] += 1
+        totals["review_count"] += event.review_count
+        for status in statuses:
+            totals["rsvps"][status] += rsvps[status]
+
+    return {"totals": totals, "events": events}
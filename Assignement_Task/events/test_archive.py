@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import get_user_model
+
+from events.archive import archive_events, restore_events
+from events.models import ArchivedEvent, ArchivedReview, ArchivedRSVP, Event, RSVP, Review
+
+User = get_user_model()
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class ArchiveTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="user", password="pass1234")
+        self.old = Event.objects.create(
+            owner=self.user, title="Old", start_time=utc(2020, 1, 1, 10), end_time=utc(2020, 1, 1, 12),
+        )
+        self.weekly = Event.objects.create(
+            owner=self.user, title="Forever weekly", start_time=utc(2020, 1, 1, 18),
+            end_time=utc(2020, 1, 1, 19), recurrence_freq="weekly",
+        )
+        self.upcoming = Event.objects.create(
+            owner=self.user, title="Upcoming", start_time=utc(2099, 1, 1, 10), end_time=utc(2099, 1, 1, 12),
+        )
+        RSVP.objects.create(user=self.user, event=self.old, status="attending")
+        Review.objects.create(user=self.user, event=self.old, rating=4, comment="ok")
+        self.old_created_at = Event.objects.get(pk=self.old.pk).created_at
+
+    def test_archive_moves_event_and_dependents(self):
+        self.assertEqual(archive_events(batch_size=1), 1)
+        self.assertEqual(set(Event.objects.values_list("title", flat=True)), {"Forever weekly", "Upcoming"})
+        self.assertTrue(ArchivedEvent.objects.filter(pk=self.old.pk).exists())
+        self.assertEqual(ArchivedRSVP.objects.count(), 1)
+        self.assertEqual(ArchivedReview.objects.count(), 1)
+        self.assertFalse(RSVP.objects.exists())
+        self.assertFalse(Review.objects.exists())
+
+    def test_restore_brings_everything_back(self):
+        call_command("archive_events", stdout=StringIO())
+        call_command("restore_events", str(self.old.pk), stdout=StringIO())
+        restored = Event.objects.get(pk=self.old.pk)
+        self.assertEqual(restored.created_at, self.old_created_at)
+        self.assertEqual(restored.rsvps.count(), 1)
+        self.assertEqual(restored.reviews.count(), 1)
+        self.assertFalse(ArchivedEvent.objects.exists())
+        self.assertEqual(restore_events([12345]), 0)
+
+    def test_api_reads_archive_only_when_asked(self):
+        archive_events()
+        detail = reverse("event-detail", args=[self.old.pk])
+        self.assertEqual(self.client.get(detail).status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(detail, {"include_archived": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["is_archived"])
+        self.assertEqual(response.data["rsvp_count"], 1)
+
+        reviews = self.client.get(reverse("event-reviews", args=[self.old.pk]), {"include_archived": 1})
+        self.assertEqual(reviews.data["results"][0]["rating"], 4)
+
+        listed = self.client.get(reverse("event-list"))
+        self.assertNotIn(self.old.pk, [e["id"] for e in listed.data["results"]])
+        listed = self.client.get(reverse("event-list"), {"include_archived": 1})
+        self.assertEqual(listed.data["count"], 3)
+        self.assertEqual(
+            [e["id"] for e in listed.data["results"]],
+            [self.weekly.pk, self.upcoming.pk, self.old.pk],
+        )
+
+    def test_malformed_pk_with_archive_fallback_is_404(self):
+        for name in ["event-detail", "event-reviews"]:
+            url = reverse(name, args=["abc"])
+            response = self.client.get(url, {"include_archived": 1})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_archived_event_cannot_be_modified(self):
+        archive_events()
+        self.client.login(username="user", password="pass1234")
+        url = reverse("event-detail", args=[self.old.pk])
+        response = self.client.patch(url + "?include_archived=1", {"title": "x"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,182 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import get_user_model
+
+from events.caching import ReadThroughCache, event_cache
+from events.models import Event, RSVP, Review
+
+User = get_user_model()
+
+
+def make_cache(**overrides):
+    options = dict(max_bytes=1024 * 1024, fresh_seconds=60, stale_seconds=60,
+                   shared_alias="default", wait_seconds=5)
+    options.update(overrides)
+    return ReadThroughCache(**options)
+
+
+class ReadThroughCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def run_blocked(self, read_cache, key, value, started):
+        """Start a leader whose compute blocks until the returned gate is set."""
+        gate = threading.Event()
+
+        def compute():
+            started.set()
+            gate.wait(5)
+            return value
+
+        thread = threading.Thread(target=read_cache.get_or_compute, args=(key, compute))
+        thread.start()
+        return thread, gate
+
+    def test_concurrent_misses_compute_once(self):
+        read_cache = make_cache()
+        started = threading.Event()
+        leader, gate = self.run_blocked(read_cache, "k", {"v": 1}, started)
+        started.wait(5)
+
+        results = []
+        followers = [
+            threading.Thread(target=lambda: results.append(read_cache.get_or_compute("k", lambda: {"v": 2})))
+            for _ in range(4)
+        ]
+        for thread in followers:
+            thread.start()
+        while read_cache.stats()["coalesced"] < 4:
+            time.sleep(0.01)
+        gate.set()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        self.assertEqual(results, [{"v": 1}] * 4)
+        stats = read_cache.stats()
+        self.assertEqual((stats["misses"], stats["coalesced"]), (1, 4))
+        self.assertEqual(read_cache.get_or_compute("k", lambda: {"v": 3}), {"v": 1})
+        self.assertEqual(read_cache.stats()["hits"], 1)
+
+    def test_stale_entry_served_while_one_request_refreshes(self):
+        read_cache = make_cache(fresh_seconds=0)
+        read_cache.get_or_compute("k", lambda: "old")
+        cache.clear()  # force the refresh past the shared tier
+
+        started = threading.Event()
+        leader, gate = self.run_blocked(read_cache, "k", "new", started)
+        started.wait(5)
+        self.assertEqual(read_cache.get_or_compute("k", lambda: "unused"), "old")
+        gate.set()
+        leader.join()
+
+        self.assertEqual(read_cache.stats()["stale_served"], 1)
+        self.assertEqual(read_cache._entries["k"].value, "new")
+
+    def test_lru_bounded_by_bytes(self):
+        read_cache = make_cache(max_bytes=25)
+        for key in "abc":
+            read_cache.get_or_compute(key, lambda: "x" * 8)  # 10 bytes rendered
+
+        stats = read_cache.stats()
+        self.assertEqual(list(read_cache._entries), ["b", "c"])
+        self.assertEqual((stats["bytes"], stats["evictions"]), (20, 1))
+
+    def test_second_process_fills_from_shared_tier(self):
+        make_cache().get_or_compute("k", lambda: [1, 2])
+        other = make_cache()
+        self.assertEqual(other.get_or_compute("k", lambda: "unused"), [1, 2])
+        self.assertEqual(other.stats()["shared_hits"], 1)
+
+
+class EventCacheApiTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        event_cache().clear()
+        now = timezone.now()
+        self.owner = User.objects.create_user(username="owner", password="pass1234")
+        self.guest = User.objects.create_user(username="guest", password="pass1234")
+        self.event = Event.objects.create(
+            owner=self.owner, title="Hot", start_time=now, end_time=now + timedelta(hours=1),
+        )
+        self.private = Event.objects.create(
+            owner=self.owner, title="Private", is_public=False,
+            start_time=now, end_time=now + timedelta(hours=1),
+        )
+        self.detail = reverse("event-detail", args=[self.event.id])
+        self.reviews = reverse("event-reviews", args=[self.event.id])
+
+    def test_repeat_reads_skip_the_database(self):
+        self.client.get(self.detail)
+        self.client.get(self.reviews)
+        with self.assertNumQueries(0):
+            detail = self.client.get(self.detail)
+            reviews = self.client.get(self.reviews)
+        self.assertEqual(detail.data["title"], "Hot")
+        self.assertEqual(reviews.data["count"], 0)
+
+    def test_entries_hold_plain_data(self):
+        self.client.get(self.detail)
+        self.client.get(self.reviews)
+        # Serializer output would pin the serializer, request and view
+        self.assertEqual(
+            {type(entry.value) for entry in event_cache()._entries.values()}, {dict},
+        )
+
+    def test_writes_invalidate(self):
+        self.client.get(self.detail)
+        self.client.get(self.reviews)
+
+        self.client.force_authenticate(self.owner)
+        self.client.patch(self.detail, {"title": "Renamed"}, format="json")
+        RSVP.objects.create(user=self.guest, event=self.event, status="attending")
+        Review.objects.create(user=self.guest, event=self.event, rating=4)
+        self.client.force_authenticate(None)
+
+        self.assertEqual(self.client.get(self.detail).data["title"], "Renamed")
+        self.assertEqual(self.client.get(self.detail).data["average_rating"], 4)
+        self.assertEqual(self.client.get(self.reviews).data["count"], 1)
+
+    def test_equivalent_pk_spellings_share_invalidation(self):
+        padded = reverse("event-detail", args=[f"0{self.event.id}"])
+        self.assertEqual(self.client.get(padded).data["title"], "Hot")
+
+        self.client.force_authenticate(self.owner)
+        self.client.patch(self.detail, {"title": "Renamed"}, format="json")
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(padded).data["title"], "Renamed")
+
+    def test_private_event_still_checked_per_user(self):
+        url = reverse("event-detail", args=[self.private.id])
+        RSVP.objects.create(user=self.guest, event=self.private, status="attending")
+        self.client.force_authenticate(self.guest)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deleted_event_not_served_from_cache(self):
+        self.client.get(self.detail)
+        self.client.force_authenticate(self.owner)
+        self.client.delete(self.detail)
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(self.detail).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_metrics_admin_only(self):
+        url = reverse("cache-metrics")
+        self.client.get(self.detail)
+        self.client.get(self.detail)
+        self.client.force_authenticate(self.owner)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        admin = User.objects.create_superuser(username="admin", password="pass1234")
+        self.client.force_authenticate(admin)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data["misses"], response.data["hits"]), (1, 1))
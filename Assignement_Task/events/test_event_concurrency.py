@@ -0,0 +1,115 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import get_user_model
+
+from events.models import Event
+
+User = get_user_model()
+
+
+class EventConcurrencyTests(APITestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.owner = User.objects.create_user(username="owner", password="pass1234")
+        self.event = Event.objects.create(
+            owner=self.owner, title="Launch", description="Original",
+            start_time=now, end_time=now + timedelta(hours=1),
+        )
+        self.url = reverse("event-detail", args=[self.event.id])
+        self.client.force_authenticate(self.owner)
+
+    def patch(self, data, **headers):
+        return self.client.patch(self.url, data, format="json", headers=headers)
+
+    def test_etag_tracks_version(self):
+        self.assertEqual(self.client.get(self.url)["ETag"], '"1"')
+
+        response = self.patch({"title": "Renamed"}, if_match='"1"')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], '"2"')
+        self.assertEqual(response.data["version"], 2)
+        self.assertEqual(self.client.get(self.url)["ETag"], '"2"')
+
+    def test_stale_if_match_rejected(self):
+        self.patch({"title": "First"}, if_match='"1"')
+        response = self.patch({"title": "Second"}, if_match='"1"')
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.event.refresh_from_db()
+        self.assertEqual((self.event.title, self.event.version), ("First", 2))
+
+    def test_weak_or_malformed_tags_never_match(self):
+        for tag in ['W/"1"', "1", '"abc"']:
+            response = self.patch({"title": "X"}, if_match=tag)
+            self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+    def test_any_listed_version_or_wildcard_matches(self):
+        self.assertEqual(self.patch({"title": "A"}, if_match='"7", "1"').status_code, status.HTTP_200_OK)
+        self.assertEqual(self.patch({"title": "B"}, if_match="*").status_code, status.HTTP_200_OK)
+        self.assertEqual(self.patch({"title": "C"}).status_code, status.HTTP_200_OK)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.version, 4)
+
+    def test_wildcard_skips_version_check(self):
+        stale = Event.objects.get(pk=self.event.pk)
+        Event.objects.get(pk=self.event.pk).save()  # someone else saves first
+
+        stale.title = "Forced"
+        self.assertTrue(stale.conditional_update(["title"], None))
+        self.assertEqual(stale.version, 3)
+        self.assertEqual(Event.objects.get(pk=self.event.pk).title, "Forced")
+
+    def test_etag_is_the_version_this_write_produced(self):
+        response = self.patch({"title": "A"}, if_match='"1", "2"')
+        self.assertEqual(response["ETag"], '"2"')
+        response = self.patch({"title": "B"}, if_match='"1", "2"')
+        self.assertEqual(response["ETag"], '"3"')
+
+    def test_wildcard_retries_past_a_concurrent_write(self):
+        update_version = Event._update_version
+        tried = []
+
+        def racing(event, version, values):
+            if not tried:
+                Event.objects.get(pk=event.pk).save()  # lands between the read and the UPDATE
+            tried.append(version)
+            return update_version(event, version, values)
+
+        with mock.patch.object(Event, "_update_version", racing):
+            response = self.patch({"title": "Wildcard"}, if_match="*")
+        self.assertEqual(tried, [1, 2])
+        self.assertEqual(response["ETag"], '"3"')
+        self.event.refresh_from_db()
+        self.assertEqual((self.event.title, self.event.version), ("Wildcard", 3))
+
+    def test_update_is_one_conditional_statement_on_changed_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.patch({"title": "Renamed"}, if_match='"1"')
+
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"title"', updates[0])
+        self.assertIn('"version" = 1', updates[0])
+        self.assertNotIn('"description"', updates[0])
+
+    def test_concurrent_writer_detected_without_if_match(self):
+        stale = Event.objects.get(pk=self.event.pk)
+        Event.objects.get(pk=self.event.pk).save()  # someone else saves first
+
+        stale.title = "Lost"
+        self.assertFalse(stale.conditional_update(["title"], [stale.version]))
+        self.event.refresh_from_db()
+        self.assertEqual((self.event.title, self.event.version), ("Launch", 2))
+
+    def test_series_end_follows_conditional_update(self):
+        end = self.event.end_time + timedelta(hours=2)
+        self.patch({"end_time": end.isoformat()}, if_match='"1"')
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.series_end, end)
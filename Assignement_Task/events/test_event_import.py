@@ -0,0 +1,104 @@
+import json
+import os
+import tempfile
+from io import BytesIO, StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import get_user_model
+
+from events.imports import iter_json_rows
+from events.models import Event
+
+User = get_user_model()
+
+CSV = (
+    "\ufefftitle,location,start_time,end_time,is_public\n"
+    "Meetup,Online,2025-03-01T18:00:00Z,2025-03-01T20:00:00Z,true\n"
+    "Backwards,,2025-03-02T18:00:00Z,2025-03-02T17:00:00Z,\n"
+    ",Nowhere,not a date,2025-03-03T20:00:00Z,maybe\n"
+    "Private,\"Room 1, floor 2\",2025-03-04T18:00:00,2025-03-04T20:00:00,no\n"
+)
+
+
+class JSONStreamTests(SimpleTestCase):
+    def test_array_split_across_chunks(self):
+        rows = [{"title": f"Event {i}", "n": i} for i in range(50)]
+        stream = BytesIO(json.dumps(rows).encode())
+        self.assertEqual(list(iter_json_rows(stream, chunk_size=7)), rows)
+
+    def test_json_lines_and_scalars(self):
+        stream = BytesIO(b'{"a": 1}\n12345\n{"b": 2}\n')
+        self.assertEqual(list(iter_json_rows(stream, chunk_size=3)), [{"a": 1}, 12345, {"b": 2}])
+
+    def test_malformed_raises(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_rows(BytesIO(b'[{"a": 1}, {"b": ]')))
+
+
+class EventImportTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="partner", password="pass1234")
+        self.url = reverse("event-bulk-import")
+
+    def test_csv_import_reports_bad_rows(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.generic("POST", self.url, CSV.encode(), content_type="text/csv")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual([e["row"] for e in response.data["errors"]], [2, 3])
+        self.assertIn("end_time", response.data["errors"][0]["errors"])
+        self.assertEqual(
+            set(response.data["errors"][1]["errors"]), {"title", "start_time", "is_public"}
+        )
+        private = Event.objects.get(title="Private")
+        self.assertFalse(private.is_public)
+        self.assertEqual(private.location, "Room 1, floor 2")
+        self.assertEqual(private.series_end, private.end_time)
+
+    def test_json_import_with_dedup(self):
+        Event.objects.create(
+            owner=self.user, title="Existing",
+            start_time="2025-03-01T18:00:00Z", end_time="2025-03-01T20:00:00Z",
+        )
+        rows = [
+            {"title": "Existing", "start_time": "2025-03-01T18:00:00Z", "end_time": "2025-03-01T20:00:00Z"},
+            {"title": "New", "start_time": "2025-03-02T18:00:00Z", "end_time": "2025-03-02T20:00:00Z"},
+            {"title": "New", "start_time": "2025-03-02T18:00:00Z", "end_time": "2025-03-02T20:00:00Z"},
+        ]
+        self.client.force_authenticate(self.user)
+        response = self.client.generic(
+            "POST", self.url + "?dedup=1", json.dumps(rows), content_type="application/json"
+        )
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(response.data["skipped"], [1, 3])
+        self.assertEqual(Event.objects.filter(title="New").count(), 1)
+
+    def test_input_format_query_parameter(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.generic(
+            "POST", self.url + "?input_format=csv", CSV.encode(), content_type="application/octet-stream"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["created"], 2)
+
+        response = self.client.generic("POST", self.url + "?input_format=xml", b"", content_type="text/csv")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("input_format", response.data)
+
+    def test_import_requires_authentication(self):
+        response = self.client.generic("POST", self.url, CSV.encode(), content_type="text/csv")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_management_command(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as f:
+            f.write(CSV)
+        self.addCleanup(os.remove, f.name)
+        out, err = StringIO(), StringIO()
+        call_command("import_events", f.name, owner="partner", batch_size=1, stdout=out, stderr=err)
+        self.assertIn("Created 2 event(s)", out.getvalue())
+        self.assertIn("row 2:", err.getvalue())
+        self.assertEqual(Event.objects.filter(owner=self.user).count(), 2)
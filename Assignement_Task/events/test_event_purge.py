@@ -0,0 +1,64 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import get_user_model
+
+from events.models import Event, EventPurge, RSVP, Review
+
+User = get_user_model()
+
+
+@override_settings(EVENT_PURGE_WORKERS=0, EVENT_PURGE_BATCH_SIZE=3)
+class EventPurgeTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username="owner", password="pass1234")
+        self.event = Event.objects.create(
+            owner=self.owner, title="Popular",
+            start_time="2025-01-01T10:00:00Z", end_time="2025-01-01T12:00:00Z",
+        )
+        for i in range(7):
+            guest = User.objects.create_user(username=f"guest{i}", password="pass1234")
+            RSVP.objects.create(user=guest, event=self.event, status="attending")
+            if i < 4:
+                Review.objects.create(user=guest, event=self.event, rating=5)
+        self.url = reverse("event-detail", args=[self.event.id])
+
+    def test_destroy_hides_then_purges_in_batches(self):
+        self.client.force_authenticate(self.owner)
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["status"], "running")
+
+        # Hidden right away, dependents still there until the purge runs
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(RSVP.objects.filter(event_id=self.event.id).count(), 7)
+
+        for callback in callbacks:
+            callback()
+
+        self.assertFalse(Event.all_objects.filter(pk=self.event.id).exists())
+        self.assertFalse(RSVP.objects.exists())
+        progress = self.client.get(reverse("event-purge-detail", args=[self.event.id]))
+        self.assertEqual(progress.data["status"], "done")
+        self.assertEqual(progress.data["rsvps_deleted"], 7)
+        self.assertEqual(progress.data["reviews_deleted"], 4)
+
+    def test_non_owner_cannot_delete(self):
+        stranger = User.objects.get(username="guest0")
+        self.client.force_authenticate(stranger)
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertIsNone(Event.objects.get(pk=self.event.id).deleted_at)
+
+    def test_interrupted_purge_is_resumed(self):
+        self.client.force_authenticate(self.owner)
+        with self.captureOnCommitCallbacks(execute=False):
+            self.client.delete(self.url)
+        call_command("purge_events", stdout=StringIO())
+        self.assertTrue(EventPurge.objects.get(event_id=self.event.id).finished_at)
+        self.assertFalse(Review.objects.exists())
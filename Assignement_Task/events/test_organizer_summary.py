@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import get_user_model
+
+from events.models import Event, RSVP, Review
+
+User = get_user_model()
+
+
+class OrganizerSummaryTests(APITestCase):
+    def setUp(self):
+        now = timezone.now()
+        self.owner = User.objects.create_user(username="owner", password="pass1234")
+        self.guests = [User.objects.create_user(username=f"g{i}", password="pass1234") for i in range(3)]
+        self.past = Event.objects.create(
+            owner=self.owner, title="Past",
+            start_time=now - timedelta(days=3), end_time=now - timedelta(days=3, hours=-1),
+        )
+        self.weekly = Event.objects.create(
+            owner=self.owner, title="Weekly",
+            start_time=now - timedelta(days=10), end_time=now - timedelta(days=10, hours=-1),
+            recurrence_freq="weekly",
+        )
+        Event.objects.create(
+            owner=self.guests[0], title="Someone else's",
+            start_time=now, end_time=now + timedelta(hours=1),
+        )
+        for guest, status_ in zip(self.guests, ["attending", "attending", "maybe"]):
+            RSVP.objects.create(user=guest, event=self.past, status=status_)
+        Review.objects.create(user=self.guests[0], event=self.past, rating=5)
+        Review.objects.create(user=self.guests[1], event=self.past, rating=2)
+        self.now = now
+        self.url = reverse("organizer-summary")
+
+    def test_summary_in_one_query(self):
+        self.client.force_authenticate(self.owner)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        by_title = {e["title"]: e for e in response.data["events"]}
+        self.assertEqual(set(by_title), {"Past", "Weekly"})
+        self.assertEqual(by_title["Past"]["rsvps"], {"attending": 2, "maybe": 1, "not_going": 0})
+        self.assertEqual(by_title["Past"]["review_count"], 2)
+        self.assertEqual(by_title["Past"]["average_rating"], 3.5)
+        self.assertIsNone(by_title["Past"]["next_occurrence"])
+        self.assertEqual(by_title["Weekly"]["review_count"], 0)
+        self.assertIsNone(by_title["Weekly"]["average_rating"])
+        self.assertEqual(
+            by_title["Weekly"]["next_occurrence"], self.weekly.start_time + timedelta(days=14)
+        )
+        self.assertEqual(response.data["totals"]["events"], 2)
+        self.assertEqual(response.data["totals"]["rsvps"]["attending"], 2)
+
+    def test_summary_requires_authentication(self):
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,73 @@
+from django.contrib.auth.hashers import make_password
+from django.conf import settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import get_user_model
+
+from events import background
+from events.hashers import HashingPoolBusy, run_in_pool
+
+User = get_user_model()
+
+
+class PasswordHashingTests(APITestCase):
+    def test_register_uses_policy_hasher(self):
+        url = reverse("register")
+        response = self.client.post(
+            url,
+            {"username": "newbie", "email": "newbie@example.com", "password": "t4ngerine-Sky"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        user = User.objects.get(username="newbie")
+        self.assertTrue(user.password.startswith(settings.PASSWORD_HASHER_POLICY))
+        self.assertTrue(user.check_password("t4ngerine-Sky"))
+
+    def test_register_keeps_baseline_password_rules(self):
+        # create_user never ran AUTH_PASSWORD_VALIDATORS; only min_length=8 applies
+        url = reverse("register")
+        response = self.client.post(
+            url,
+            {"username": "newbie", "email": "newbie@example.com", "password": "password123"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = self.client.post(
+            url, {"username": "other", "email": "other@example.com", "password": "short"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_login_rehashes_legacy_password(self):
+        user = User.objects.create_user(username="legacy", password="x")
+        user.password = make_password("t4ngerine-Sky", hasher="pbkdf2_sha256")
+        user.save(update_fields=["password"])
+
+        url = reverse("jwt_login")
+        response = self.client.post(
+            url, {"username": "legacy", "password": "t4ngerine-Sky"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith(settings.PASSWORD_HASHER_POLICY))
+
+    def test_login_wrong_password_keeps_hash(self):
+        user = User.objects.create_user(username="someone", password="t4ngerine-Sky")
+        before = user.password
+
+        url = reverse("jwt_login")
+        response = self.client.post(
+            url, {"username": "someone", "password": "nope"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        user.refresh_from_db()
+        self.assertEqual(user.password, before)
+
+    def test_pool_rejects_when_full(self):
+        with self.settings(PASSWORD_HASHING_QUEUE=0, PASSWORD_HASHING_TIMEOUT=0):
+            background._executors.clear()
+            try:
+                with self.assertRaises(HashingPoolBusy):
+                    run_in_pool(make_password, "t4ngerine-Sky")
+            finally:
+                background._executors.clear()
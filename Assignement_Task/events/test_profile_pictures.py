@@ -0,0 +1,92 @@
+import os
+import shutil
+import tempfile
+from io import BytesIO
+
+from PIL import Image
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import get_user_model
+
+from events.models import Event, UserProfile
+
+User = get_user_model()
+
+
+def make_image(size=(300, 200), color="red", noise=False):
+    buffer = BytesIO()
+    if noise:
+        image = Image.frombytes("RGB", size, os.urandom(size[0] * size[1] * 3))
+    else:
+        image = Image.new("RGB", size, color)
+    image.save(buffer, "PNG")
+    return SimpleUploadedFile("pic.png", buffer.getvalue(), content_type="image/png")
+
+
+@override_settings(PROFILE_PICTURE_WORKERS=0)
+class ProfilePictureTests(APITestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+        self.user = User.objects.create_user(username="user", password="pass1234")
+        self.other = User.objects.create_user(username="other", password="pass1234")
+        self.url = reverse("profile-picture")
+
+    def upload(self, user, image):
+        self.client.force_authenticate(user)
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.put(self.url, {"profile_picture": image}, format="multipart")
+
+    def test_upload_is_content_addressed_and_deduplicated(self):
+        first = self.upload(self.user, make_image())
+        second = self.upload(self.other, make_image())
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+
+        mine = UserProfile.objects.get(user=self.user).profile_picture.name
+        theirs = UserProfile.objects.get(user=self.other).profile_picture.name
+        self.assertEqual(mine, theirs)
+        self.assertRegex(mine, r"^profiles/[0-9a-f]{2}/[0-9a-f]{64}\.png$")
+        _, files = default_storage.listdir(mine.rsplit("/", 1)[0])
+        self.assertEqual(len([f for f in files if f.endswith(".png")]), 1)
+
+    def test_thumbnails_generated_and_served(self):
+        self.upload(self.user, make_image())
+        profile = UserProfile.objects.get(user=self.user)
+        self.assertEqual(profile.thumbnail_sizes, [64, 128, 256])
+
+        event = Event.objects.create(
+            owner=self.user, title="E", start_time="2025-01-01T10:00:00Z",
+            end_time="2025-01-01T12:00:00Z",
+        )
+        url = reverse("event-detail", args=[event.id])
+        small = self.client.get(url, {"picture_size": 50}).data["owner"]["profile"]["profile_picture"]
+        default = self.client.get(url).data["owner"]["profile"]["profile_picture"]
+        original = self.client.get(url, {"picture_size": "original"}).data["owner"]["profile"]["profile_picture"]
+        self.assertTrue(small.endswith("_64.webp"))
+        self.assertTrue(default.endswith("_128.webp"))
+        self.assertTrue(original.endswith(".png"))
+
+    @override_settings(PROFILE_PICTURE_MAX_BYTES=1024)
+    def test_oversized_upload_rejected(self):
+        response = self.upload(self.user, make_image(size=(400, 400), noise=True))
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertFalse(UserProfile.objects.filter(user=self.user).exists())
+
+    @override_settings(PROFILE_PICTURE_MAX_DIMENSIONS=(100, 100))
+    def test_oversized_dimensions_rejected(self):
+        response = self.upload(self.user, make_image())
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_non_image_rejected(self):
+        bogus = SimpleUploadedFile("pic.png", b"not an image", content_type="image/png")
+        response = self.upload(self.user, bogus)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,172 @@
+from datetime import datetime, timedelta, timezone
+
+from django.urls import reverse
+from django.test import TestCase
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import get_user_model
+
+from events.models import Event, RSVP
+from events.recurrence import iter_occurrences, series_end
+
+User = get_user_model()
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def make_event(**kwargs):
+    defaults = {"start_time": utc(2025, 1, 1, 18), "end_time": utc(2025, 1, 1, 20)}
+    defaults.update(kwargs)
+    return Event(**defaults)
+
+
+class RecurrenceExpansionTests(TestCase):
+    def starts(self, event, start=None, end=None):
+        return [o.start for o in iter_occurrences(event, start, end)]
+
+    def test_weekly_with_count(self):
+        event = make_event(recurrence_freq="weekly", recurrence_count=3)
+        self.assertEqual(
+            self.starts(event),
+            [utc(2025, 1, 1, 18), utc(2025, 1, 8, 18), utc(2025, 1, 15, 18)],
+        )
+        self.assertEqual(series_end(event), utc(2025, 1, 15, 20))
+
+    def test_window_skips_ahead_in_open_series(self):
+        event = make_event(recurrence_freq="daily", recurrence_interval=2)
+        self.assertEqual(
+            self.starts(event, utc(2030, 1, 1), utc(2030, 1, 5)),
+            [utc(2030, 1, 1, 18), utc(2030, 1, 3, 18)],
+        )
+        self.assertIsNone(series_end(event))
+
+    def test_window_includes_occurrence_in_progress(self):
+        event = make_event(recurrence_freq="daily")
+        self.assertEqual(self.starts(event, utc(2025, 1, 3, 19), utc(2025, 1, 3, 21)), [utc(2025, 1, 3, 18)])
+
+    def test_monthly_skips_missing_days(self):
+        event = make_event(
+            start_time=utc(2025, 1, 31, 18), end_time=utc(2025, 1, 31, 19),
+            recurrence_freq="monthly", recurrence_count=3,
+        )
+        self.assertEqual(
+            self.starts(event),
+            [utc(2025, 1, 31, 18), utc(2025, 3, 31, 18), utc(2025, 5, 31, 18)],
+        )
+
+    def test_until_and_exdates(self):
+        event = make_event(
+            recurrence_freq="weekly",
+            recurrence_until=utc(2025, 1, 22, 18),
+            recurrence_exdates=[utc(2025, 1, 8, 18).isoformat()],
+        )
+        self.assertEqual(
+            self.starts(event),
+            [utc(2025, 1, 1, 18), utc(2025, 1, 15, 18), utc(2025, 1, 22, 18)],
+        )
+
+    def test_series_end_computed_without_walking(self):
+        huge = make_event(recurrence_freq="daily", recurrence_count=2_000_000)
+        self.assertEqual(series_end(huge), utc(2025, 1, 1, 20) + timedelta(days=1_999_999))
+        until = make_event(recurrence_freq="weekly", recurrence_interval=2, recurrence_until=utc(2025, 2, 1))
+        self.assertEqual(series_end(until), utc(2025, 1, 29, 20))
+        before = make_event(recurrence_freq="daily", recurrence_until=utc(2024, 12, 1))
+        self.assertEqual(series_end(before), utc(2025, 1, 1, 20))
+        with self.assertRaises(OverflowError):
+            series_end(make_event(recurrence_freq="weekly", recurrence_count=600_000))
+
+    def test_open_series_stops_at_datetime_max(self):
+        event = make_event(start_time=utc(9999, 12, 1, 18), end_time=utc(9999, 12, 1, 20), recurrence_freq="weekly")
+        self.assertEqual(len(self.starts(event)), 5)
+
+
+class RecurringEventAPITests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="user", password="pass1234")
+        self.series = Event.objects.create(
+            owner=self.user, title="Meetup",
+            start_time=utc(2025, 1, 1, 18), end_time=utc(2025, 1, 1, 20),
+            recurrence_freq="weekly",
+        )
+        self.single = Event.objects.create(
+            owner=self.user, title="Launch",
+            start_time=utc(2025, 1, 10, 9), end_time=utc(2025, 1, 10, 10),
+        )
+        Event.objects.create(
+            owner=self.user, title="Old",
+            start_time=utc(2024, 1, 10, 9), end_time=utc(2024, 1, 10, 10),
+        )
+
+    def test_calendar_expands_window(self):
+        url = reverse("event-occurrences")
+        response = self.client.get(url, {"start": "2025-01-05T00:00:00Z", "end": "2025-01-20T00:00:00Z"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        titles = [(o["title"], o["start"]) for o in response.data["results"]]
+        self.assertEqual(titles, [
+            ("Meetup", "2025-01-08T18:00:00Z"),
+            ("Launch", "2025-01-10T09:00:00Z"),
+            ("Meetup", "2025-01-15T18:00:00Z"),
+        ])
+        self.assertIsNone(response.data["next_start"])
+
+    def test_calendar_limit_reports_next_start(self):
+        url = reverse("event-occurrences")
+        response = self.client.get(url, {"start": "2025-01-05T00:00:00Z", "end": "2025-03-01T00:00:00Z", "limit": 2})
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertEqual(response.data["next_start"], utc(2025, 1, 15, 18))
+
+    def test_rsvp_per_occurrence(self):
+        self.client.login(username="user", password="pass1234")
+        url = reverse("event-rsvp", args=[self.series.id])
+        for when in ("2025-01-08T18:00:00Z", "2025-01-15T18:00:00Z", "2025-01-15T18:00:00Z"):
+            response = self.client.post(url, {"status": "attending", "occurrence_start": when}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(RSVP.objects.filter(event=self.series).count(), 2)
+
+        response = self.client.post(url, {"status": "attending", "occurrence_start": "2025-01-09T18:00:00Z"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(url, {"status": "attending"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_rsvp_still_editable_after_rule_change(self):
+        self.client.login(username="user", password="pass1234")
+        rsvp = self.client.post(
+            reverse("event-rsvp", args=[self.single.id]), {"status": "attending"}, format="json",
+        ).data
+        self.client.patch(
+            reverse("event-detail", args=[self.single.id]), {"recurrence_freq": "weekly"}, format="json",
+        )
+
+        url = reverse("rsvp-detail", args=[rsvp["id"]])
+        response = self.client.patch(url, {"status": "maybe"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "maybe")
+        # Moving it still has to name a real occurrence
+        response = self.client.patch(url, {"occurrence_start": None}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_rejects_oversized_series(self):
+        self.client.login(username="user", password="pass1234")
+        base = {"title": "Forever", "start_time": "2025-01-03T10:00:00Z", "end_time": "2025-01-03T12:00:00Z"}
+        for rule in (
+            {"recurrence_freq": "weekly", "recurrence_count": 600000},
+            {"recurrence_freq": "daily", "recurrence_until": "9999-01-01T00:00:00Z"},
+            {"recurrence_freq": "weekly", "recurrence_interval": 30000, "recurrence_count": 500},
+        ):
+            response = self.client.post(reverse("event-list"), {**base, **rule}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, rule)
+
+        response = self.client.post(reverse("event-list"), {
+            **base, "recurrence_freq": "daily", "recurrence_until": "2034-01-01T00:00:00Z",
+        }, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_create_rejects_rule_without_freq(self):
+        self.client.login(username="user", password="pass1234")
+        response = self.client.post(reverse("event-list"), {
+            "title": "Bad", "start_time": "2025-01-03T10:00:00Z",
+            "end_time": "2025-01-03T12:00:00Z", "recurrence_count": 3,
+        }, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
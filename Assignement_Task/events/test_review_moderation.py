@@ -0,0 +1,143 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import get_user_model
+
+from events.caching import event_cache
+from events.models import Event, RSVP, Review
+from events.moderation import DUPLICATE, RATE, Moderator, moderate_existing, moderator, similarity, sketch
+
+User = get_user_model()
+
+SPAM = "Cheap tickets for every concert at example dot com, use code SAVE20 today!"
+SPAM_VARIANT = "cheap tickets for EVERY concert at example dot com -- use code SAVE20 today"
+HONEST = "The keynote ran long but the workshops afterwards were really well organised."
+
+
+class SketchTests(SimpleTestCase):
+    def test_similarity_estimates(self):
+        spam = sketch(SPAM, 5, 64)
+        self.assertEqual(similarity(spam, sketch(SPAM, 5, 64), 64), 1.0)
+        self.assertGreaterEqual(similarity(spam, sketch(SPAM_VARIANT, 5, 64), 64), 0.8)
+        self.assertLess(similarity(spam, sketch(HONEST, 5, 64), 64), 0.2)
+
+    def test_too_short_to_shingle(self):
+        self.assertIsNone(sketch("ok!", 5, 64))
+
+
+class ModeratorTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        event_cache().clear()
+        now = timezone.now()
+        self.users = [User.objects.create_user(username=f"u{i}", password="pass1234") for i in range(4)]
+        self.events = [
+            Event.objects.create(
+                owner=self.users[0], title=f"E{i}", start_time=now, end_time=now + timedelta(hours=1),
+            )
+            for i in range(4)
+        ]
+
+    def review(self, user, event, comment, **kwargs):
+        return Review(user=self.users[user], event=self.events[event], rating=5, comment=comment, **kwargs)
+
+    def test_near_duplicates_on_same_event_flagged(self):
+        first, copy, elsewhere, short, short_copy = Moderator(seed=False).score([
+            self.review(0, 0, SPAM),
+            self.review(1, 0, SPAM_VARIANT),
+            self.review(2, 1, SPAM_VARIANT),
+            self.review(2, 0, "Great event!"),
+            self.review(3, 0, "Great event!"),
+        ])
+        self.assertEqual((first.status, first.flags), (Review.PUBLISHED, []))
+        self.assertEqual((copy.status, copy.flags), (Review.PENDING, [DUPLICATE]))
+        self.assertEqual(elsewhere.status, Review.PUBLISHED)
+        self.assertEqual(short_copy.status, Review.PUBLISHED)
+
+    def test_review_rate_per_user(self):
+        now = timezone.now()
+        scored = Moderator(seed=False, RATE_LIMIT=2).score([
+            self.review(0, event, "", created_at=now + timedelta(minutes=event)) for event in range(3)
+        ] + [self.review(0, 3, "", created_at=now + timedelta(hours=2))])
+        self.assertEqual([r.flags for r in scored], [[], [], [RATE], []])
+
+    def test_index_keeps_recent_reviews_only(self):
+        scored = Moderator(seed=False, RECENT_PER_EVENT=1).score([
+            self.review(0, 0, SPAM), self.review(1, 0, HONEST), self.review(2, 0, SPAM_VARIANT),
+        ])
+        self.assertEqual(scored[-1].status, Review.PUBLISHED)
+
+    def test_seeded_from_database(self):
+        Review.objects.create(user=self.users[0], event=self.events[0], rating=5, comment=SPAM)
+        for user in self.users[1:3]:
+            Review.objects.create(user=user, event=self.events[1], rating=5, comment="")
+
+        fresh = Moderator(RATE_LIMIT=1)
+        copy, busy = fresh.score([self.review(3, 0, SPAM_VARIANT), self.review(2, 2, HONEST)])
+        self.assertEqual(copy.flags, [DUPLICATE])
+        self.assertEqual(busy.flags, [RATE])
+
+    def test_batch_rescoring_demotes_published_only(self):
+        Review.objects.create(user=self.users[0], event=self.events[0], rating=5, comment=SPAM)
+        copy = Review.objects.create(user=self.users[1], event=self.events[0], rating=1, comment=SPAM)
+        rejected = Review.objects.create(
+            user=self.users[2], event=self.events[0], rating=1, comment=SPAM, status=Review.REJECTED,
+        )
+        detail = reverse("event-detail", args=[self.events[0].id])
+        self.assertEqual(self.client.get(detail).data["average_rating"], 3)
+
+        self.assertEqual(moderate_existing(batch_size=2), (3, 1))
+        # The cached detail must not keep counting the demoted review
+        self.assertEqual(self.client.get(detail).data["average_rating"], 5)
+        copy.refresh_from_db()
+        rejected.refresh_from_db()
+        self.assertEqual((copy.status, copy.flags), (Review.PENDING, [DUPLICATE]))
+        self.assertEqual(rejected.status, Review.REJECTED)
+
+
+class ReviewModerationApiTests(APITestCase):
+    def setUp(self):
+        moderator().clear()
+        now = timezone.now()
+        self.owner = User.objects.create_user(username="owner", password="pass1234")
+        self.event = Event.objects.create(
+            owner=self.owner, title="Gig", start_time=now, end_time=now + timedelta(hours=1),
+        )
+        self.guests = [User.objects.create_user(username=f"g{i}", password="pass1234") for i in range(2)]
+        for guest in self.guests:
+            RSVP.objects.create(user=guest, event=self.event, status="attending")
+
+    def post_review(self, guest, rating, comment):
+        self.client.force_authenticate(guest)
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse("review-list"), {"event_id": self.event.id, "rating": rating, "comment": comment},
+            )
+
+    def test_duplicate_held_as_pending_and_hidden(self):
+        first = self.post_review(self.guests[0], 5, SPAM)
+        second = self.post_review(self.guests[1], 1, SPAM_VARIANT)
+        self.assertEqual(first.data["status"], Review.PUBLISHED)
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.data["status"], Review.PENDING)
+
+        self.client.force_authenticate(None)
+        reviews = self.client.get(reverse("event-reviews", args=[self.event.id]))
+        self.assertEqual(reviews.data["count"], 1)
+        detail = self.client.get(reverse("event-detail", args=[self.event.id]))
+        self.assertEqual(detail.data["average_rating"], 5)
+
+    def test_failed_save_not_indexed(self):
+        self.post_review(self.guests[0], 5, HONEST)
+        # Second review by the same user violates unique_together
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self.post_review(self.guests[0], 1, SPAM)
+
+        response = self.post_review(self.guests[1], 1, SPAM_VARIANT)
+        self.assertEqual(response.data["status"], Review.PUBLISHED)
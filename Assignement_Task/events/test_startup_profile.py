@@ -0,0 +1,31 @@
+import subprocess
+import sys
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+
+class StartupProfileTests(SimpleTestCase):
+    def test_api_only_profile_boots_and_serves(self):
+        out = StringIO()
+        call_command(
+            "profile_startup", "eventproj.settings_api",
+            path="/api/home", runs=1, top=3, stdout=out,
+        )
+        report = out.getvalue()
+        self.assertIn("import self-time by top-level package", report)
+        self.assertRegex(report, r"eventproj\.settings_api\s+200\s")
+
+    def test_setup_does_not_import_drf_renderers(self):
+        # Every manage.py command runs django.setup(); EventsConfig.ready() must stay cheap
+        code = (
+            "import os, sys, django; "
+            "os.environ['DJANGO_SETTINGS_MODULE'] = 'eventproj.settings'; "
+            "django.setup(); print('rest_framework.renderers' in sys.modules)"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code], cwd=settings.BASE_DIR, capture_output=True, text=True,
+        )
+        self.assertEqual(completed.stdout.strip(), "False", completed.stderr)
@@ -0,0 +1,141 @@
+import hashlib
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadhandler import StopUpload, TemporaryFileUploadHandler
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from . import background
+from .models import UserProfile
+
+# Pillow format -> stored file extension
+IMAGE_EXTENSIONS = {"JPEG": "jpg", "PNG": "png", "GIF": "gif", "WEBP": "webp"}
+
+
+# ---------------------------------------------------------
+# 1. STREAMING UPLOAD HANDLER
+# ---------------------------------------------------------
+class ProfilePictureUploadHandler(TemporaryFileUploadHandler):
+    """
+    Streams each uploaded file to a temporary file chunk by chunk, hashing
+    it on the way and aborting once PROFILE_PICTURE_MAX_BYTES is exceeded.
+    The finished file carries its SHA-256 digest as ``file.sha256``.
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.too_large = False
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.digest = hashlib.sha256()
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > settings.PROFILE_PICTURE_MAX_BYTES:
+            self.too_large = True
+            raise StopUpload()
+        self.digest.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        file.sha256 = self.digest.hexdigest()
+        return file
+
+
+# ---------------------------------------------------------
+# 2. CONTENT-ADDRESSED STORAGE
+# ---------------------------------------------------------
+def thumbnail_name(name, size):
+    """``profiles/ab/abcd….png`` -> ``profiles/ab/abcd…_128.webp``"""
+    return f"{os.path.splitext(name)[0]}_{size}.webp"
+
+
+def pick_thumbnail_size(available, wanted):
+    """Smallest generated size that still covers ``wanted``, else None."""
+    fitting = [size for size in available if size >= wanted]
+    return min(fitting) if fitting else None
+
+
+def store_profile_picture(profile, uploaded):
+    """
+    Check the upload and store it under its content hash.
+
+    Identical images share one file, so the stored name (and URL) never
+    changes for a given content and can be cached forever. Thumbnails are
+    generated after the transaction commits.
+    """
+    # Pillow is imported on first upload, not when serializers load
+    from PIL import Image
+
+    try:
+        with Image.open(uploaded) as image:
+            image_format = image.format
+            width, height = image.size
+            image.verify()
+    except (OSError, SyntaxError, Image.DecompressionBombError):
+        raise ValidationError({"profile_picture": ["Upload a valid image."]})
+
+    if image_format not in IMAGE_EXTENSIONS:
+        raise ValidationError({"profile_picture": [f"Unsupported image format: {image_format}."]})
+
+    max_width, max_height = settings.PROFILE_PICTURE_MAX_DIMENSIONS
+    if width > max_width or height > max_height:
+        raise ValidationError({
+            "profile_picture": [f"Image must be at most {max_width}x{max_height} pixels."]
+        })
+
+    digest = getattr(uploaded, "sha256", None)
+    if digest is None:
+        uploaded.seek(0)
+        digest = hashlib.file_digest(uploaded, "sha256").hexdigest()
+
+    name = f"profiles/{digest[:2]}/{digest}.{IMAGE_EXTENSIONS[image_format]}"
+    if not default_storage.exists(name):
+        uploaded.seek(0)
+        name = default_storage.save(name, uploaded)
+
+    if profile.profile_picture.name != name:
+        profile.profile_picture.name = name
+        profile.thumbnail_sizes = []
+        profile.save(update_fields=["profile_picture", "thumbnail_sizes"])
+        transaction.on_commit(lambda: schedule_thumbnails(profile.pk, name))
+    return profile
+
+
+# ---------------------------------------------------------
+# 3. BACKGROUND THUMBNAILS
+# ---------------------------------------------------------
+def schedule_thumbnails(profile_id, name):
+    """Generate thumbnails off the request path (inline with 0 workers)."""
+    return background.submit("PROFILE_PICTURE_WORKERS", generate_thumbnails, profile_id, name)
+
+
+def generate_thumbnails(profile_id, name):
+    """
+    Write every PROFILE_PICTURE_THUMBNAIL_SIZES variant of ``name`` that does
+    not exist yet and record the sizes on the profile.
+    """
+    from PIL import Image, ImageOps
+
+    sizes = sorted(settings.PROFILE_PICTURE_THUMBNAIL_SIZES)
+    missing = [size for size in sizes if not default_storage.exists(thumbnail_name(name, size))]
+
+    if missing:
+        with default_storage.open(name) as f, Image.open(f) as image:
+            image = ImageOps.exif_transpose(image).convert("RGBA")
+            for size in missing:
+                thumb = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+                buffer = BytesIO()
+                thumb.save(buffer, "WEBP", quality=85)
+                default_storage.save(thumbnail_name(name, size), ContentFile(buffer.getvalue()))
+
+    # Only record sizes if the profile still points at this picture
+    UserProfile.objects.filter(pk=profile_id, profile_picture=name).update(thumbnail_sizes=sizes)
+    return sizes
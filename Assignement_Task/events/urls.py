@@ -1,14 +1,18 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import EventViewSet, RSVPViewSet, ReviewViewSet , RegisterView, home  
+from .views import EventViewSet, RSVPViewSet, ReviewViewSet, EventPurgeViewSet, RegisterView, ProfilePictureView, OrganizerSummaryView, CacheMetricsView, home  
 
 router = DefaultRouter()
 router.register(r"events", EventViewSet, basename="event")
 router.register(r"rsvp", RSVPViewSet, basename="rsvp")
 router.register(r"reviews", ReviewViewSet, basename="review")
+router.register(r"event-purges", EventPurgeViewSet, basename="event-purge")
 
 urlpatterns = [
     path("", include(router.urls)),
     path("home", home, name="home"),
     path("auth/register/", RegisterView.as_view(), name="register"),
+    path("me/profile/picture/", ProfilePictureView.as_view(), name="profile-picture"),
+    path("me/events/summary/", OrganizerSummaryView.as_view(), name="organizer-summary"),
+    path("cache/metrics/", CacheMetricsView.as_view(), name="cache-metrics"),
 ]
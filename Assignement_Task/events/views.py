@@ -1,13 +1,30 @@
 # Create your views here.
+from django.conf import settings
+from itertools import islice
+
+from django.http import Http404
 from django.shortcuts import get_object_or_404, render
-from rest_framework import viewsets, status, filters
+from rest_framework import viewsets, status, filters, generics
 from rest_framework.response import Response
+from rest_framework.parsers import MultiPartParser
+from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.decorators import action
 from django_filters.rest_framework import DjangoFilterBackend
 
-from .models import Event, RSVP, Review
-from .serializers import EventSerializer, RSVPSerializer, ReviewSerializer
+from .models import ArchivedEvent, Event, EventPurge, RSVP, Review, UserProfile
+from .archive import TieredSequence
+from .caching import event_cache, event_key, invalidate_event
+from .concurrency import etag, if_match_versions
+from .purge import request_event_purge
+from .imports import IMPORT_FORMATS, import_events, iter_rows
+from .serializers import (
+    EventSerializer, RSVPSerializer, ReviewSerializer, EventPurgeSerializer,
+    OccurrenceSerializer, OccurrenceWindowSerializer, UserProfileSerializer,
+)
+from .uploads import ProfilePictureUploadHandler, store_profile_picture
+from .recurrence import merge_occurrences
+from .summary import organizer_summary
 from .permissions import IsOrganizerOrReadOnly, IsInvitedOrPublic
 
 
@@ -27,8 +44,8 @@ class EventViewSet(viewsets.ModelViewSet):
 
     def get_permissions(self):
 
-        # CREATE → must be authenticated
-        if self.action == "create":
+        # CREATE / IMPORT → must be authenticated
+        if self.action in ["create", "bulk_import"]:
             return [IsAuthenticated()]
 
         # UPDATE/DELETE → only organizer
@@ -39,21 +56,119 @@ class EventViewSet(viewsets.ModelViewSet):
         if self.action == "retrieve":
             return [IsInvitedOrPublic()]
 
-        # LIST → public events only
-        if self.action == "list":
+        # LIST / CALENDAR → public events only
+        if self.action in ["list", "occurrences"]:
             return [AllowAny()]
 
         return [permission() for permission in self.permission_classes]
     
     def get_queryset(self):
         """Public list → show only public events"""
-        if self.action == "list":
+        if self.action in ["list", "occurrences"]:
             return Event.objects.filter(is_public=True)
         return Event.objects.all()
 
+    # -------------------------
+    # ARCHIVE FALL-THROUGH (?include_archived=1)
+    # -------------------------
+    def include_archived(self):
+        return self.request.query_params.get("include_archived") in ("1", "true")
+
+    def list(self, request, *args, **kwargs):
+        """With ?include_archived=1, pages continue into archived events."""
+        if not self.include_archived():
+            return super().list(request, *args, **kwargs)
+
+        events = TieredSequence(
+            self.filter_queryset(self.get_queryset()),
+            self.filter_queryset(ArchivedEvent.objects.filter(is_public=True)),
+        )
+        page = self.paginate_queryset(events)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        return Response(self.get_serializer(events[:len(events)], many=True).data)
+
+    def get_object(self):
+        """Read-only actions may fall back to the archive when asked to."""
+        try:
+            return super().get_object()
+        except Http404:
+            if self.action not in ["retrieve", "reviews"] or not self.include_archived():
+                raise
+        # DRF's variant also turns a malformed pk into a 404, as super() does
+        event = generics.get_object_or_404(ArchivedEvent, pk=self.kwargs["pk"])
+        self.check_object_permissions(self.request, event)
+        return event
+
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
 
+    # -------------------------
+    # OPTIMISTIC CONCURRENCY (ETag / If-Match)
+    # -------------------------
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action in ["update", "partial_update"]:
+            context["if_match"] = if_match_versions(self.request)
+        return context
+
+    def update(self, request, *args, **kwargs):
+        response = super().update(request, *args, **kwargs)
+        response["ETag"] = etag(response.data["version"])
+        return response
+
+    def perform_update(self, serializer):
+        serializer.save()
+        # conditional_update() bypasses save(), so no post_save signal
+        invalidate_event(serializer.instance.pk)
+
+    # -------------------------
+    # HOT-EVENT READ CACHE
+    # -------------------------
+    def cached(self, view, allowed_params, compute):
+        """
+        Serve ``compute()`` through the event cache when the query string only
+        holds ``allowed_params``; returns None when the request is not cacheable.
+        """
+        params = self.request.query_params
+        if not set(params) <= set(allowed_params):
+            return None
+        try:
+            # Same key for /events/1/ and /events/01/; invalidation uses the int pk
+            pk = int(self.kwargs["pk"])
+        except ValueError:
+            return None
+        key = event_key(
+            pk, view, self.request.get_host(),
+            *(params.get(name, "") for name in allowed_params),
+        )
+        return event_cache().get_or_compute(key, compute)
+
+    def retrieve(self, request, *args, **kwargs):
+        """Public event details come from the cache; private ones are checked per user."""
+        def public_detail():
+            # No per-user checks here: the result is shared by every caller
+            event = get_object_or_404(self.get_queryset(), pk=self.kwargs["pk"])
+            return self.get_serializer(event).data if event.is_public else None
+
+        data = self.cached("detail", ["picture_size"], public_detail)
+        if data is None:
+            response = super().retrieve(request, *args, **kwargs)
+        else:
+            response = Response(data)
+        response["ETag"] = etag(response.data["version"])
+        return response
+
+    def destroy(self, request, *args, **kwargs):
+        """
+        Hide the event immediately and purge its RSVPs/reviews in batches in
+        the background; progress at /api/event-purges/{id}/.
+        """
+        event = self.get_object()
+        purge = request_event_purge(event, request.user)
+        return Response(EventPurgeSerializer(purge).data, status=status.HTTP_202_ACCEPTED)
+
     # -------------------------
     # RSVP
     # -------------------------
@@ -68,13 +183,72 @@ class EventViewSet(viewsets.ModelViewSet):
         serializer.save()
         return Response(serializer.data, status=201)
 
+    # -------------------------
+    # BULK IMPORT
+    # -------------------------
+    @action(detail=False, methods=["post"], url_path="import")
+    def bulk_import(self, request):
+        """
+        POST /api/events/import/[?input_format=csv|json][&dedup=1] → import
+        the request body (CSV, JSON array or JSON lines) as the caller's
+        events. Without input_format the Content-Type decides (``format`` is
+        DRF's renderer override). The body is parsed as a stream; bad rows
+        are reported, not fatal.
+        """
+        import_format = request.query_params.get("input_format")
+        if import_format is None:
+            import_format = "csv" if "csv" in request.content_type else "json"
+        if import_format not in IMPORT_FORMATS:
+            return Response(
+                {"input_format": [f"Must be one of: {', '.join(IMPORT_FORMATS)}."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if request.stream is None:
+            return Response({"detail": "Empty request body."}, status=status.HTTP_400_BAD_REQUEST)
+
+        result = import_events(
+            iter_rows(request.stream, import_format),
+            owner=request.user,
+            dedup=request.query_params.get("dedup") in ("1", "true"),
+        )
+        return Response(result, status=status.HTTP_200_OK)
+
+    # -------------------------
+    # OCCURRENCES (CALENDAR)
+    # -------------------------
+    @action(detail=False, methods=["get"])
+    def occurrences(self, request):
+        """
+        GET /api/events/occurrences/?start=&end=[&limit=] → occurrences of
+        public events overlapping the window, ordered by start. Recurring
+        series are expanded lazily, so only ``limit`` occurrences are built;
+        continue from ``next_start`` for more.
+        """
+        window = OccurrenceWindowSerializer(data=request.query_params)
+        window.is_valid(raise_exception=True)
+        start, end, limit = (window.validated_data[k] for k in ("start", "end", "limit"))
+
+        events = self.filter_queryset(self.get_queryset()).overlapping(start, end)
+        occurrences = list(islice(merge_occurrences(events.iterator(), start, end), limit + 1))
+        next_start = occurrences[limit].start if len(occurrences) > limit else None
+
+        serializer = OccurrenceSerializer(occurrences[:limit], many=True)
+        return Response({"next_start": next_start, "results": serializer.data})
+
     # -------------------------
     # REVIEWS FOR EVENT
     # -------------------------
     @action(detail=True, methods=["get"], permission_classes=[AllowAny])
     def reviews(self, request, pk=None):
+        if request.query_params.get("page", "1") == "1":
+            data = self.cached("reviews", ["page"], lambda: self.review_page().data)
+            if data is not None:
+                return Response(data)
+        return self.review_page()
+
+    def review_page(self):
         event = self.get_object()
-        reviews = event.reviews.all()
+        reviews = event.reviews.filter(status=Review.PUBLISHED)
 
         # Pagination enabled
         page = self.paginate_queryset(reviews)
@@ -96,9 +270,22 @@ class RSVPViewSet(viewsets.ModelViewSet):
     http_method_names = ["patch"]  # Only update allowed
 
     def get_queryset(self):
-        return RSVP.objects.filter(user=self.request.user)
+        return RSVP.objects.filter(user=self.request.user, event__deleted_at__isnull=True)
 
     
+# -----------------------------------
+# EVENT PURGE PROGRESS
+# -----------------------------------
+class EventPurgeViewSet(viewsets.ReadOnlyModelViewSet):
+    """GET /api/event-purges/{event_id}/ → progress of the caller's deletes"""
+    serializer_class = EventPurgeSerializer
+    permission_classes = [IsAuthenticated]
+    lookup_field = "event_id"
+
+    def get_queryset(self):
+        return EventPurge.objects.filter(requested_by=self.request.user)
+
+
 # -----------------------------------
 # REVIEW VIEWSET
 # -----------------------------------
@@ -137,3 +324,66 @@ class RegisterView(generics.CreateAPIView):
     """
     serializer_class = RegisterSerializer
     permission_classes = [permissions.AllowAny]
+
+
+# -----------------------------------
+# PROFILE PICTURE UPLOAD
+# -----------------------------------
+class ProfilePictureView(APIView):
+    """
+    PUT /api/me/profile/picture/ → replace the caller's profile picture
+    (multipart field ``profile_picture``)
+    """
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def initialize_request(self, request, *args, **kwargs):
+        # Must be installed before anything (auth, CSRF) touches the body
+        self.upload_handler = ProfilePictureUploadHandler(request)
+        request.upload_handlers = [self.upload_handler]
+        return super().initialize_request(request, *args, **kwargs)
+
+    def put(self, request):
+        uploaded = request.FILES.get("profile_picture")
+        if self.upload_handler.too_large:
+            return Response(
+                {"profile_picture": [f"File exceeds {settings.PROFILE_PICTURE_MAX_BYTES} bytes."]},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        if uploaded is None:
+            return Response(
+                {"profile_picture": ["No file was submitted."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        profile, _ = UserProfile.objects.get_or_create(
+            user=request.user,
+            defaults={"full_name": request.user.get_full_name() or request.user.get_username()},
+        )
+        store_profile_picture(profile, uploaded)
+        return Response(UserProfileSerializer(profile, context={"request": request}).data)
+
+
+# -----------------------------------
+# ORGANIZER DASHBOARD
+# -----------------------------------
+class OrganizerSummaryView(APIView):
+    """
+    GET /api/me/events/summary/ → RSVP counts by status, review count,
+    average rating and next occurrence for every event the caller owns
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response(organizer_summary(request.user))
+
+
+# -----------------------------------
+# CACHE METRICS
+# -----------------------------------
+class CacheMetricsView(APIView):
+    """GET /api/cache/metrics/ → hit/miss/coalescing counters of this process's event cache."""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(event_cache().stats())